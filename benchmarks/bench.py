@@ -0,0 +1,173 @@
+"""Benchmarks for the extraction, filtering, renewal lookup, export and rendering hot paths.
+
+Run from the repository root:
+
+    python benchmarks/bench.py                      # 1k, 100k and 1M
+    python benchmarks/bench.py --sizes 1000 --only filter export_csv
+
+Simulated fetch delays are switched off, so the numbers measure our own
+code. Each result records wall time and items/sec, and the whole run is
+written as JSON (default: bench_results.json) for comparison over time.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_core import (  # noqa: E402
+    CertIndex,
+    EnhancedLinkedInScraper,
+    LinkedInScraper,
+    available_formats,
+    create_profile_card,
+    synthetic_profiles,
+    write_export,
+)
+
+
+def _urls(n):
+    return [f"https://www.linkedin.com/in/bench-{i}" for i in range(n)]
+
+
+def bench_process_urls(n):
+    scraper = LinkedInScraper(simulate_delay=False)
+    urls = _urls(n)
+    start = time.perf_counter()
+    scraper.process_urls(urls)
+    return time.perf_counter() - start, n
+
+
+def bench_process_urls_enhanced(n):
+    scraper = EnhancedLinkedInScraper(simulate_delay=False)
+    urls = _urls(n)
+    start = time.perf_counter()
+    scraper.process_urls(urls)
+    return time.perf_counter() - start, n
+
+
+def bench_dataframe_build(n):
+    scraper = EnhancedLinkedInScraper(simulate_delay=False)
+    items = [scraper.process_url(url) for url in _urls(n)]
+    start = time.perf_counter()
+    builder = scraper.new_result_builder()
+    for base, certs, _ in items:
+        builder.add(base, certs)
+    builder.to_frame()
+    return time.perf_counter() - start, n
+
+
+def bench_filter(n):
+    df = synthetic_profiles(n, seed=0)
+    classifier = EnhancedLinkedInScraper(simulate_delay=False).hr_classifier
+    start = time.perf_counter()
+    mask = classifier.classify_frame(df)
+    mask &= df['certification'] != ''
+    mask &= df['years_experience'] >= 5
+    df[mask]
+    return time.perf_counter() - start, len(df)
+
+
+def bench_renewal_index(n):
+    df = synthetic_profiles(n, seed=0)
+    start = time.perf_counter()
+    CertIndex(df)
+    return time.perf_counter() - start, len(df)
+
+
+def bench_renewal_query(n):
+    # One index build, then the app's typical questions: a cert's and a provider's renewals due soon
+    df = synthetic_profiles(n, seed=0)
+    index = CertIndex(df)
+    window = index.due_window(90)
+    start = time.perf_counter()
+    for certification in index.categories['certification']:
+        index.lookup(*window, certification=certification)
+    for provider in index.categories['provider']:
+        index.lookup(*window, provider=provider)
+    queries = len(index.categories['certification']) + len(index.categories['provider'])
+    return time.perf_counter() - start, queries
+
+
+def _bench_export(fmt, compress=False):
+    # Exports go through the streaming engine to a real file, as the apps and CLI do
+    def bench(n):
+        df = synthetic_profiles(n, seed=0)
+        with tempfile.TemporaryFile() as f:
+            start = time.perf_counter()
+            write_export(df, f, fmt, compress)
+            return time.perf_counter() - start, len(df)
+    return bench
+
+
+def bench_profile_cards(n):
+    scraper = EnhancedLinkedInScraper(simulate_delay=False)
+    profiles = [scraper.generate_detailed_profile(url) for url in _urls(n)]
+    start = time.perf_counter()
+    for profile in profiles:
+        create_profile_card(profile)
+    return time.perf_counter() - start, n
+
+
+BENCHMARKS = {
+    'process_urls': bench_process_urls,
+    'process_urls_enhanced': bench_process_urls_enhanced,
+    'dataframe_build': bench_dataframe_build,
+    'filter': bench_filter,
+    'renewal_index': bench_renewal_index,
+    'renewal_query': bench_renewal_query,
+    'export_csv': _bench_export('csv'),
+    'export_csv_gzip': _bench_export('csv', compress=True),
+    'export_excel': _bench_export('excel'),
+    'export_json': _bench_export('json'),
+    'export_ndjson': _bench_export('ndjson'),
+    'profile_cards': bench_profile_cards,
+}
+if 'parquet' in available_formats():
+    BENCHMARKS['export_parquet'] = _bench_export('parquet')
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='run just these benchmarks')
+    parser.add_argument('-o', '--output', default='bench_results.json')
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.only or BENCHMARKS:
+        for size in args.sizes:
+            seconds, items = BENCHMARKS[name](size)
+            rate = items / seconds if seconds else float('inf')
+            results.append({'benchmark': name, 'size': size, 'items': items, 'seconds': seconds, 'items_per_sec': rate})
+            print(f"{name:<24}{size:>10,}  {seconds:9.3f}s  {rate:14,.0f} items/s", file=sys.stderr)
+
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Shared extraction engine used by the LinkedIn HR extractor apps."""
+
+from .assets import background_css, head_injection, particles_script, read_asset
+from .cache import CacheEntry, ProfileCache, cache_key, content_digest
+from .cards import CardCache, card_key, create_profile_card, page_count, render_cards, render_gallery_page
+from .certs import CERTIFICATION_CATALOG, CertIndex, month_ordinal, parse_months
+from .classify import HRClassifier
+from .concurrency import HostLimiter, endpoint_key, host_key, imap_ordered, map_ordered
+from .export import (
+    EXPORT_FORMATS,
+    available_formats,
+    export_filename,
+    export_mime,
+    iter_chunks,
+    iter_record_chunks,
+    spool_export,
+    write_export,
+)
+from .fetch import CircuitBreaker, CircuitOpenError, FetchError, HttpFetcher
+from .ingest import iter_url_chunks, load_urls, read_header
+from .journal import JobJournal, job_id
+from .metrics import Metrics, start_metrics_server
+from .progress import ProgressEvent, ProgressStream
+from .ratelimit import RateLimiter, shared_rate_limiter
+from .results import ResultBuilder
+from .scrapers import EnhancedLinkedInScraper, LinkedInScraper
+from .sharding import imap_sharded, map_sharded
+from .standin import StandInServer
+from .synthetic import iter_synthetic_profiles, synthetic_profiles
+from .urls import UrlIndex, canonicalize_url, profile_digest, profile_endpoint, url_set_key, validate_urls
+
+__all__ = [
+    'CERTIFICATION_CATALOG',
+    'CacheEntry',
+    'CardCache',
+    'CertIndex',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'EXPORT_FORMATS',
+    'EnhancedLinkedInScraper',
+    'FetchError',
+    'HRClassifier',
+    'HostLimiter',
+    'HttpFetcher',
+    'JobJournal',
+    'LinkedInScraper',
+    'Metrics',
+    'ProfileCache',
+    'ProgressEvent',
+    'ProgressStream',
+    'RateLimiter',
+    'ResultBuilder',
+    'StandInServer',
+    'UrlIndex',
+    'available_formats',
+    'background_css',
+    'cache_key',
+    'canonicalize_url',
+    'card_key',
+    'content_digest',
+    'create_profile_card',
+    'endpoint_key',
+    'export_filename',
+    'export_mime',
+    'head_injection',
+    'host_key',
+    'imap_ordered',
+    'imap_sharded',
+    'iter_chunks',
+    'iter_record_chunks',
+    'iter_synthetic_profiles',
+    'iter_url_chunks',
+    'job_id',
+    'load_urls',
+    'map_ordered',
+    'map_sharded',
+    'month_ordinal',
+    'page_count',
+    'parse_months',
+    'particles_script',
+    'profile_digest',
+    'profile_endpoint',
+    'read_asset',
+    'read_header',
+    'render_cards',
+    'render_gallery_page',
+    'shared_rate_limiter',
+    'spool_export',
+    'start_metrics_server',
+    'synthetic_profiles',
+    'url_set_key',
+    'validate_urls',
+    'write_export',
+]
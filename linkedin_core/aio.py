@@ -0,0 +1,98 @@
+"""asyncio counterparts of the scrapers' extraction loop.
+
+Rate-limit waits are awaited on the event loop; the blocking pieces (cache
+reads/writes and HTTP requests over the requests session) run on a thread
+pool, so a service's loop is never blocked. Simulated profiles are cheap
+and generated on the loop itself.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .urls import UrlIndex, profile_endpoint
+
+
+async def aget_profile(scraper, url, generate, executor=None):
+    """Async scraper.get_profile; generate(url) builds the simulated profile."""
+    loop = asyncio.get_running_loop()
+    if scraper.cache is not None and scraper.cache.refresh_age is not None:
+        # Revalidation reads, fetches and writes the cache in one step; run it on the pool
+        return await loop.run_in_executor(executor, scraper.get_profile, url)
+    if scraper.cache is not None:
+        data = await loop.run_in_executor(executor, scraper.cache.get, url)
+        if data is not None:
+            scraper.metrics.incr('cache_hits')
+            return data
+        scraper.metrics.incr('cache_misses')
+
+    if scraper.endpoint:
+        # Retries, backoff and the limiter's per-attempt waits happen on the worker thread
+        data = await loop.run_in_executor(executor, scraper.fetcher.get_json,
+                                          profile_endpoint(scraper.endpoint, url))
+    else:
+        if scraper.simulate_delay:
+            await scraper.rate_limiter.acquire_async(url)
+        data = generate(url)
+        if scraper.simulate_delay:
+            scraper.rate_limiter.reward(url)
+
+    if scraper.cache is not None:
+        await loop.run_in_executor(executor, scraper.cache.put, url, data)
+    return data
+
+
+async def aiter_extracted(scraper, urls, concurrency=64, progress=None):
+    """Yield (url, scraper.aextract_profile(url)) for each distinct profile, in completion order.
+
+    At most concurrency lookups run at once (an asyncio.Semaphore), and
+    blocking I/O gets a private thread pool of the same size. Cancelling
+    the consuming task, or closing the iterator early, cancels every
+    lookup still in flight; a request already running on a thread is
+    finished there but its result is dropped.
+    """
+    index = UrlIndex(urls)
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    if scraper.endpoint:
+        scraper.fetcher.size_pool(concurrency)
+
+    async def extract(url):
+        async with semaphore:
+            start = time.perf_counter()
+            item = await scraper.aextract_profile(url, executor)
+            elapsed = time.perf_counter() - start
+            scraper.metrics.add_stage('fetch', elapsed)
+            scraper.metrics.observe_latency(elapsed)
+            return url, item
+
+    if progress is not None:
+        progress.start(len(index.unique) + index.invalid, index.invalid)
+    hits_before = scraper.metrics.counters.get('cache_hits', 0)
+    pending = set()
+    remaining = iter(index.unique)
+    try:
+        with scraper.metrics.stage('run'):
+            # Keep a bounded window of tasks so huge batches don't create
+            # one task per URL up front
+            while True:
+                for url in remaining:
+                    pending.add(asyncio.ensure_future(extract(url)))
+                    if len(pending) >= concurrency * 2:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url, item = task.result()
+                    if progress is not None:
+                        progress.update(item is not None, scraper.metrics.counters.get('cache_hits', 0) - hits_before)
+                    yield url, item
+        if progress is not None:
+            progress.finish()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        executor.shutdown(wait=False, cancel_futures=True)
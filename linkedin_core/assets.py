@@ -0,0 +1,75 @@
+"""Static page assets, built once per process and injected once per session."""
+
+import base64
+import json
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def read_asset(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def background_css(image_file):
+    """CSS rule setting a PNG as the fixed, full-page app background."""
+    with open(image_file, 'rb') as f:
+        encoded = base64.b64encode(f.read()).decode()
+    return (
+        '.stApp {\n'
+        f'    background-image: url("data:image/png;base64,{encoded}");\n'
+        '    background-size: cover;\n'
+        '    background-repeat: no-repeat;\n'
+        '    background-attachment: fixed;\n'
+        '}\n'
+    )
+
+
+def head_injection(element_id, tag, content):
+    """HTML snippet that adds <tag id=element_id> to the parent page's <head>.
+
+    Meant for st.components.v1.html: the element lands in the top-level
+    document, so it survives reruns, and a second injection with the same
+    id is a no-op.
+    """
+    payload = json.dumps(content).replace('</', '<\\/')
+    return (
+        '<script>\n'
+        '(function () {\n'
+        '  const doc = window.parent.document;\n'
+        f'  if (doc.getElementById({json.dumps(element_id)})) return;\n'
+        f'  const el = doc.createElement({json.dumps(tag)});\n'
+        f'  el.id = {json.dumps(element_id)};\n'
+        f'  el.textContent = {payload};\n'
+        '  doc.head.appendChild(el);\n'
+        '})();\n'
+        '</script>\n'
+    )
+
+
+@lru_cache(maxsize=None)
+def particles_script(max_particles=20, interval_ms=3000, lifetime_ms=20000):
+    """Floating-emoji animation that runs a single interval per page.
+
+    A window-level guard keeps repeat injections from stacking timers, and
+    no new particle is created while max_particles are on screen or the
+    tab is hidden.
+    """
+    return f"""(function () {{
+  if (window.__hrParticles) return;
+  window.__hrParticles = true;
+  const symbols = ['💼', '👔', '📊', '🎯', '⭐', '💡'];
+  setInterval(function () {{
+    if (document.hidden || document.querySelectorAll('.particle').length >= {max_particles}) return;
+    const particle = document.createElement('div');
+    particle.className = 'particle';
+    particle.textContent = symbols[Math.floor(Math.random() * symbols.length)];
+    particle.style.left = Math.random() * 100 + 'vw';
+    particle.style.animationDuration = (Math.random() * 10 + 10) + 's';
+    particle.style.opacity = Math.random() * 0.8 + 0.2;
+    document.body.appendChild(particle);
+    setTimeout(function () {{ particle.remove(); }}, {lifetime_ms});
+  }}, {interval_ms});
+}})();
+"""
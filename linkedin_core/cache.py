@@ -0,0 +1,198 @@
+"""SQLite-backed profile cache with TTL and LRU eviction."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlparse
+
+from .fetch import FetchError
+from .urls import canonicalize_url
+
+# Fields that change on every extraction without the profile itself changing
+VOLATILE_FIELDS = ('last_updated',)
+
+CacheEntry = namedtuple('CacheEntry', 'data age etag digest')
+
+
+def cache_key(url):
+    """Canonical profile URL, falling back to a loosely normalized URL."""
+    canonical = canonicalize_url(url)
+    if canonical is not None:
+        return canonical
+    parsed = urlparse(str(url).strip())
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/').lower()}"
+
+
+def content_digest(data, volatile=VOLATILE_FIELDS):
+    """Stable hash of a profile's content, ignoring volatile fields such as last_updated."""
+    content = {k: v for k, v in data.items() if k not in volatile}
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':')).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ProfileCache:
+    """Persistent cache of extracted profile dicts keyed by profile URL.
+
+    Entries older than ttl seconds are treated as misses. When more than
+    max_entries are stored, the least recently used ones are evicted; the
+    size check runs every evict_every writes so puts stay cheap.
+
+    With refresh_age, the scrapers run in incremental refresh mode (see
+    refresh()): entries younger than refresh_age seconds are served as
+    they are, older ones are revalidated upstream and only replaced when
+    their ETag or content hash changed.
+    """
+
+    evict_every = 256
+
+    def __init__(self, path, ttl=7 * 24 * 3600, max_entries=100_000, key=cache_key, refresh_age=None):
+        self.path = path
+        self.ttl = ttl
+        self.refresh_age = refresh_age
+        self.max_entries = max_entries
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS profiles ('
+                ' key TEXT PRIMARY KEY,'
+                ' data TEXT NOT NULL,'
+                ' created REAL NOT NULL,'
+                ' accessed REAL NOT NULL,'
+                ' etag TEXT,'
+                ' digest TEXT)'
+            )
+            # Caches written before refresh mode lack the revalidation columns
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(profiles)')}
+            for column in ('etag', 'digest'):
+                if column not in columns:
+                    self._conn.execute(f'ALTER TABLE profiles ADD COLUMN {column} TEXT')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS profiles_accessed ON profiles (accessed)')
+            self._evict()
+
+    def get(self, url):
+        k = self.key(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT data, created FROM profiles WHERE key = ?', (k,)).fetchone()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute('UPDATE profiles SET accessed = ? WHERE key = ?', (now, k))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def entry(self, url):
+        """CacheEntry for url whatever its age (age is seconds since it was stored or revalidated), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, created, etag, digest FROM profiles WHERE key = ?', (self.key(url),)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), time.time() - row[1], row[2], row[3])
+
+    def put(self, url, data, etag=None):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO profiles (key, data, created, accessed, etag, digest)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (self.key(url), json.dumps(data), now, now, etag, content_digest(data)),
+            )
+            self._puts += 1
+            if self._puts % self.evict_every == 0:
+                self._evict()
+
+    def touch(self, url, etag=None):
+        """Mark url's entry as revalidated now, keeping its data (and its ETag unless a new one is given)."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE profiles SET created = ?, accessed = ?, etag = COALESCE(?, etag) WHERE key = ?',
+                (now, now, etag, self.key(url)),
+            )
+
+    def refresh(self, url, fetch, max_age=None):
+        """Incremental refresh of one profile; returns (data, outcome).
+
+        fetch(url, etag) returns (data, etag), with data None when the
+        upstream answered 304 Not Modified. Entries younger than max_age
+        (default refresh_age) are 'fresh' and nothing is fetched. Older
+        ones are revalidated: if the upstream reports no change, or the
+        refetched content hashes the same, the stored profile is carried
+        forward as 'unchanged', keeping its original last_updated;
+        otherwise it is replaced ('changed'). Unknown URLs are 'new'. If
+        revalidation fails with FetchError, the stored profile is served
+        as 'stale' and left due for the next refresh.
+
+        Whenever the stored profile is served (fresh, unchanged, stale) the
+        lookup counts as a hit, as in the scrapers' cache_hits metric; new
+        and changed profiles are misses.
+        """
+        max_age = self.refresh_age if max_age is None else max_age
+        cached = self.entry(url)
+        if cached is not None and max_age is not None and cached.age <= max_age:
+            with self._lock:
+                self.hits += 1
+            return cached.data, 'fresh'
+        try:
+            data, etag = fetch(url, cached.etag if cached is not None else None)
+        except FetchError:
+            if cached is None:
+                raise
+            with self._lock:
+                self.hits += 1
+            return cached.data, 'stale'
+        if cached is not None and (data is None or content_digest(data) == cached.digest):
+            self.touch(url, etag)
+            with self._lock:
+                self.hits += 1
+            return cached.data, 'unchanged'
+        with self._lock:
+            self.misses += 1
+        self.put(url, data, etag)
+        return data, 'new' if cached is None else 'changed'
+
+    def _evict(self):
+        if self.ttl is not None:
+            self._conn.execute('DELETE FROM profiles WHERE created < ?', (time.time() - self.ttl,))
+        if self.max_entries is None:
+            return
+        excess = self._conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                'DELETE FROM profiles WHERE key IN (SELECT key FROM profiles ORDER BY accessed LIMIT ?)',
+                (excess,),
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM profiles')
+        self.hits = self.misses = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
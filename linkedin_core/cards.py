@@ -0,0 +1,95 @@
+"""HTML profile cards for the enhanced app.
+
+Card markup only carries class names; the styling lives in
+static/enhanced.css, which the app injects once per session.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from html import escape
+
+from .sharding import map_sharded
+
+
+def create_profile_card(profile_data):
+    """Create an enhanced profile card with detailed information"""
+    p = {k: escape(str(v)) for k, v in profile_data.items() if k not in ('skills', 'certifications')}
+
+    skills_html = "".join(f'<span class="skill-chip">{escape(skill)}</span>' for skill in profile_data['skills'][:6])
+
+    if profile_data['certifications']:
+        certs_html = "<br>".join(f"🏆 <strong>{escape(cert['name'])}</strong> ({escape(cert['provider'])})"
+                                 for cert in profile_data['certifications'])
+    else:
+        certs_html = "No certifications listed"
+
+    return f"""<div class="profile-card">
+<div class="card-header"><img src="{p['profile_photo']}" class="profile-photo"><div>
+<h3>{p['profile_name']}</h3>
+<p class="card-title">{p['job_title']}</p>
+<p class="card-location">📍 {p['location']}</p>
+</div></div>
+<div class="card-section">
+<strong>🏢 Company:</strong> {p['company_name']}<br>
+<strong>⏱️ Experience:</strong> {p['years_experience']} years<br>
+<strong>🎓 Education:</strong> {p['education']}<br>
+<strong>👥 Team Size:</strong> {p['employee_count']}
+</div>
+<div class="card-section"><strong>💪 Top Skills:</strong><br><div>{skills_html}</div></div>
+<div class="card-section"><strong>🏆 Certifications:</strong><br><div class="card-certs">{certs_html}</div></div>
+<div class="card-footer">
+<p class="card-summary">"{p['summary']}"</p>
+<div class="card-meta"><span>Profile Strength: {p['profile_strength']}</span><span>Updated: {p['last_updated']}</span></div>
+</div>
+</div>"""
+
+
+def render_cards(profiles, processes=None):
+    """Card HTML for every profile, rendered across a process pool."""
+    return map_sharded(create_profile_card, profiles, processes, shard_size=500)
+
+
+def card_key(profile_data):
+    """(profile id, content hash): a changed profile gets a new key, so stale cards are never served."""
+    digest = hashlib.blake2b(json.dumps(profile_data, sort_keys=True, default=str).encode(), digest_size=8)
+    return profile_data.get('profile_id') or profile_data.get('linkedin_url'), digest.hexdigest()
+
+
+class CardCache:
+    """Thread-safe LRU cache of card HTML keyed by card_key(profile)."""
+
+    def __init__(self, max_entries=5000):
+        self.max_entries = max_entries
+        self._cards = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, profile_data):
+        key = card_key(profile_data)
+        with self._lock:
+            html = self._cards.get(key)
+            if html is not None:
+                self._cards.move_to_end(key)
+                return html
+        html = create_profile_card(profile_data)
+        with self._lock:
+            self._cards[key] = html
+            if len(self._cards) > self.max_entries:
+                self._cards.popitem(last=False)
+        return html
+
+    def __len__(self):
+        return len(self._cards)
+
+
+def page_count(total, page_size):
+    return max(1, -(-total // page_size))
+
+
+def render_gallery_page(profiles, page=1, page_size=24, cache=None):
+    """One page (1-based) of profiles as a single card-grid HTML block."""
+    start = (page - 1) * page_size
+    build = create_profile_card if cache is None else cache.get
+    cards = "".join(build(profile) for profile in profiles[start:start + page_size])
+    return f'<div class="card-gallery">{cards}</div>'
@@ -0,0 +1,144 @@
+"""Shared certification catalog and an index for renewal-window queries."""
+
+from datetime import date, timedelta
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+# One read-only catalog for the whole process: name -> (provider, type)
+CERTIFICATION_CATALOG = MappingProxyType({
+    'SHRM-CP': ('SHRM', 'HR Management'),
+    'PHR': ('HRCI', 'HR Professional'),
+    'SPHR': ('HRCI', 'Senior HR Professional'),
+    'CHRP': ('HRPA', 'Chartered HR Professional'),
+    'GPHR': ('HRCI', 'Global Professional in HR'),
+    'SHRM-SCP': ('SHRM', 'Senior Certified Professional'),
+    'CCP': ('WorldatWork', 'Certified Compensation Professional'),
+    'CEBS': ('IFEBP', 'Certified Employee Benefit Specialist'),
+})
+
+# The subset the basic scraper draws from
+BASIC_CERTIFICATIONS = MappingProxyType({
+    name: CERTIFICATION_CATALOG[name] for name in ('SHRM-CP', 'PHR', 'SPHR', 'CHRP')
+})
+
+MISSING_MONTH = -1
+
+
+def month_ordinal(when):
+    """Month ordinal (year * 12 + month - 1) of a date, datetime or Timestamp."""
+    return when.year * 12 + when.month - 1
+
+
+def _parse_month(value):
+    try:
+        month, year = str(value).split('/')
+        month, year = int(month), int(year)
+    except ValueError:
+        return MISSING_MONTH
+    return year * 12 + month - 1 if 1 <= month <= 12 else MISSING_MONTH
+
+
+def parse_months(values):
+    """'MM/YYYY' values to an int32 array of month ordinals.
+
+    Only the distinct values are parsed (a few dozen months however many
+    rows there are) and the result is spread back by their codes, so
+    millions of rows take milliseconds. Blank or malformed values become
+    MISSING_MONTH.
+    """
+    codes, uniques = pd.factorize(values)
+    table = np.array([_parse_month(v) for v in uniques] + [MISSING_MONTH], dtype=np.int32)
+    return table[codes]
+
+
+class CertIndex:
+    """Certification rows of a result frame, indexed for renewal-window queries.
+
+    Built once per result table: issued/renewal are parsed into int32
+    month ordinals, certification/provider/type into category codes, and
+    for each of those keys the rows are sorted by (key, renewal month).
+    lookup() then narrows to one key's block and binary-searches the
+    renewal window, so a query costs a slice rather than a scan.
+    """
+
+    keys = ('certification', 'provider', 'type')
+
+    def __init__(self, frame):
+        self.frame = frame
+        # Positions of the rows that carry a certification (uncertified profiles keep a blank row)
+        self.rows = np.flatnonzero((frame['certification'] != '').to_numpy())
+        certs = frame[list(self.keys) + ['issued', 'renewal']].iloc[self.rows]
+        self.issued_month = parse_months(certs['issued'])
+        self.renewal_month = parse_months(certs['renewal'])
+        self.categories = {}
+        self.codes = {}
+        self._order = {}
+        self._bounds = {}
+        self._by_month = np.argsort(self.renewal_month, kind='stable').astype(np.int32)
+        for key in self.keys:
+            codes, uniques = pd.factorize(certs[key], sort=True)
+            self.categories[key] = pd.Index(uniques)
+            self.codes[key] = codes = codes.astype(np.int16 if len(uniques) < 2 ** 15 else np.int32)
+            # A stable sort of the month-ordered rows by key: radix sort on small codes, O(n)
+            order = self._by_month[np.argsort(codes[self._by_month], kind='stable')]
+            self._order[key] = order
+            self._bounds[key] = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _code(self, key, value):
+        if key not in self.keys:
+            raise ValueError(f"unknown certification key {key!r}; expected one of {self.keys}")
+        return self.categories[key].get_indexer([value])[0]
+
+    def _select(self, start, end, filters):
+        # Positions among the cert rows, ordered by renewal month
+        codes = {key: self._code(key, value) for key, value in filters.items() if value is not None}
+        if any(code < 0 for code in codes.values()):
+            return self._by_month[:0]
+        if codes:
+            # The first filter picks the sorted block; any others are checked on what is left
+            key, code = next(iter(codes.items()))
+            block = self._order[key][self._bounds[key][code]:self._bounds[key][code + 1]]
+        else:
+            block = self._by_month
+        months = self.renewal_month[block]
+        lo = MISSING_MONTH + 1 if start is None else max(start, MISSING_MONTH + 1)
+        first = np.searchsorted(months, lo, side='left')
+        last = len(months) if end is None else np.searchsorted(months, end, side='right')
+        picked = block[first:last]
+        for key, code in list(codes.items())[1:]:
+            picked = picked[self.codes[key][picked] == code]
+        return picked
+
+    def lookup(self, start=None, end=None, **filters):
+        """Frame positions of certs renewing in months start..end (inclusive ordinals), by renewal month.
+
+        filters narrow by exact certification, provider and/or type, e.g.
+        lookup(start, end, certification='PHR'); None means any.
+        """
+        return self.rows[self._select(start, end, filters)]
+
+    def renewals_between(self, start, end, **filters):
+        """Rows whose renewal falls between two dates (month precision, inclusive)."""
+        return self.frame.take(self.lookup(month_ordinal(start), month_ordinal(end), **filters))
+
+    @staticmethod
+    def due_window(days=90, today=None):
+        """(start, end) month ordinals from this month through the month days from today."""
+        today = today or date.today()
+        return month_ordinal(today), month_ordinal(today + timedelta(days=days))
+
+    def renewals_due(self, days=90, today=None, **filters):
+        """Rows renewing within the next days days (month precision), soonest first."""
+        return self.frame.take(self.lookup(*self.due_window(days, today), **filters))
+
+    def renewals_by_month(self, start=None, end=None, **filters):
+        """Number of renewals per month ('YYYY-MM'), for charting."""
+        months = self.renewal_month[self._select(start, end, filters)]
+        values, counts = np.unique(months, return_counts=True)
+        labels = [f"{v // 12}-{v % 12 + 1:02d}" for v in values]
+        return pd.Series(counts, index=labels, name='renewals')
@@ -0,0 +1,45 @@
+"""Compiled HR-relevance classifier for job titles and departments."""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+
+class HRClassifier:
+    """Decides whether a (title, department) pair is HR-related.
+
+    The keywords are compiled once into a single case-insensitive pattern
+    of whole words, each allowing one of a few inflectional endings
+    (ENDINGS), so 'recruit' still covers 'Recruiter' and 'Recruitment'
+    while 'hr' does not match 'Hrithik' and 'people' does not match
+    'PeopleSoft'. Results are memoized per distinct pair.
+    """
+
+    ENDINGS = ('s', 'es', 'er', 'ers', 'ing', 'ment', 'ments')
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        alternatives = '|'.join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+        endings = '|'.join(self.ENDINGS)
+        self.pattern = re.compile(rf'\b(?:{alternatives})(?:{endings})?\b', re.IGNORECASE)
+        self._memo = {}
+
+    def __call__(self, title, dept):
+        key = (title, dept)
+        result = self._memo.get(key)
+        if result is None:
+            result = self._memo[key] = self.pattern.search(f"{title} {dept}") is not None
+        return result
+
+    def classify_frame(self, df, title_col='job_title', dept_col='department'):
+        """Boolean Series over df, classifying each distinct pair only once."""
+        title_codes, titles = pd.factorize(df[title_col], use_na_sentinel=False)
+        dept_codes, depts = pd.factorize(df[dept_col], use_na_sentinel=False)
+        pair_codes, pairs = pd.factorize(title_codes.astype(np.int64) * len(depts) + dept_codes)
+        labels = np.fromiter(
+            (self(titles[p // len(depts)], depts[p % len(depts)]) for p in pairs),
+            dtype=bool,
+            count=len(pairs),
+        )
+        return pd.Series(labels[pair_codes], index=df.index, name='is_hr_related')
@@ -0,0 +1,122 @@
+"""Headless batch extraction: python -m linkedin_core [URL_FILE] [-o OUT]."""
+
+import argparse
+import json
+import sys
+
+from .cache import ProfileCache
+from .export import EXPORT_FORMATS, write_export
+from .ingest import load_urls
+from .journal import JobJournal, job_id
+from .metrics import Metrics, start_metrics_server
+from .progress import ProgressStream
+from .ratelimit import RateLimiter
+from .scrapers import EnhancedLinkedInScraper, LinkedInScraper
+
+
+def read_urls(path, column=None):
+    """URLs from a text file (one per line), a CSV/XLSX column, or stdin for '-'."""
+    if path == '-':
+        return [line.strip() for line in sys.stdin if line.strip()]
+    if column is not None:
+        with open(path, 'rb') as f:
+            return load_urls(f, path, column)
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def infer_format(output):
+    """(format, gzip) from an output file name such as results.ndjson.gz; csv otherwise."""
+    compress = output.endswith('.gz')
+    name = output[:-3] if compress else output
+    for fmt, (extension, _) in EXPORT_FORMATS.items():
+        if name.endswith(extension):
+            return fmt, compress
+    return 'csv', compress
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m linkedin_core', description=__doc__)
+    parser.add_argument('input', nargs='?', default='-', help="URL file, or '-' for stdin (default)")
+    parser.add_argument('-c', '--column', help='read URLs from this column of a CSV/XLSX input')
+    parser.add_argument('-o', '--output', default='-', help="output file, or '-' for stdout (default)")
+    parser.add_argument('-f', '--format', choices=list(EXPORT_FORMATS), help='output format (default: from extension, else csv)')
+    parser.add_argument('-z', '--gzip', action='store_true', help='gzip the output (implied by a .gz output name)')
+    parser.add_argument('--enhanced', action='store_true', help='use the detailed (Pro) profile schema')
+    parser.add_argument('--endpoint', help="fetch profiles as JSON from this URL template, e.g. 'http://127.0.0.1:8000/in/{slug}'")
+    parser.add_argument('--rate', type=float, default=8.0, help='starting requests/sec per host; adapts to 429s (default: 8)')
+    parser.add_argument('--burst', type=int, default=16, help='requests a host may receive back to back (default: 16)')
+    parser.add_argument('-w', '--workers', type=int, default=8, help='parallel workers (default: 8)')
+    parser.add_argument('-p', '--processes', type=int, help='shard simulated generation across N processes (not with --endpoint, --cache or --job-id)')
+    parser.add_argument('--cache', help='SQLite profile cache file')
+    parser.add_argument('--job-id', help='checkpoint progress under this id; rerun with it to resume')
+    parser.add_argument('--journal-dir', default='.jobs', help='directory for job journals (default: .jobs)')
+    parser.add_argument('--cache-ttl', type=float, default=7 * 24 * 3600, help='cache TTL in seconds')
+    parser.add_argument('--refresh-age', type=float,
+                        help='incremental refresh: reuse cached profiles younger than this many seconds and '
+                             're-extract older ones only if their ETag or content changed (needs --cache)')
+    parser.add_argument('--progress', action='store_true', help='report progress, throughput and ETA on stderr')
+    parser.add_argument('--metrics-port', type=int, help='serve Prometheus metrics on localhost:PORT/metrics during the run')
+    parser.add_argument('--metrics-json', help="write the run's stage/latency summary as JSON to this file ('-' for stderr)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.refresh_age is not None and not args.cache:
+        parser.error('--refresh-age needs --cache')
+    if args.processes:
+        # Worker processes run without the cache, journal and rate limiter, so these would be silently ignored
+        clashing = [flag for flag, value in (('--endpoint', args.endpoint), ('--cache', args.cache), ('--job-id', args.job_id)) if value]
+        if clashing:
+            parser.error(f"-p/--processes cannot be combined with {', '.join(clashing)}")
+    fmt, compress = infer_format(args.output)
+    fmt = args.format or fmt
+    compress = compress or args.gzip
+
+    cache = ProfileCache(args.cache, ttl=args.cache_ttl, refresh_age=args.refresh_age) if args.cache else None
+    metrics = Metrics()
+    server = start_metrics_server(metrics, args.metrics_port) if args.metrics_port else None
+    urls = read_urls(args.input, args.column)
+    progress = None
+    if args.progress:
+        progress = ProgressStream(interval=1.0)
+        progress.subscribe(lambda event: print(event.describe(), file=sys.stderr))
+    # Result batches are written as they are produced, so memory stays flat however large the run
+    scraper = (EnhancedLinkedInScraper if args.enhanced else LinkedInScraper)(
+        cache=cache, metrics=metrics, endpoint=args.endpoint, rate_limiter=RateLimiter(args.rate, args.burst))
+    # Journals hold one scraper type's rows, so a basic and an --enhanced run never share one
+    journal = JobJournal(job_id(scraper, args.job_id), args.journal_dir) if args.job_id else None
+    if journal is not None and len(journal):
+        print(f"Resuming job {args.job_id}: {len(journal)} profiles already done.", file=sys.stderr)
+    batches = scraper.iter_process_urls(urls, max_workers=args.workers, batch_size=10_000, journal=journal,
+                                        processes=args.processes, progress=progress)
+    if args.enhanced:
+        batches = (frame for frame, _ in batches)
+    if args.output == '-':
+        rows = write_export(batches, sys.stdout.buffer, fmt, compress, metrics)
+        sys.stdout.buffer.flush()
+    else:
+        rows = write_export(batches, args.output, fmt, compress, metrics)
+    if journal is not None:
+        journal.remove()
+
+    print(f"Processed {len(urls)} URLs into {rows} rows.", file=sys.stderr)
+    fetch_errors = metrics.counters.get('fetch_errors', 0)
+    if fetch_errors:
+        print(f"{fetch_errors} profiles could not be fetched and are missing from the output.", file=sys.stderr)
+    if cache is not None:
+        print(f"Cache: {cache.stats()}", file=sys.stderr)
+        if args.refresh_age is not None:
+            outcomes = {o: metrics.counters.get(f'refresh_{o}', 0) for o in ('fresh', 'unchanged', 'changed', 'new', 'stale')}
+            print(f"Refresh: {outcomes}", file=sys.stderr)
+        cache.close()
+    if args.metrics_json == '-':
+        print(json.dumps(metrics.summary(), indent=2), file=sys.stderr)
+    elif args.metrics_json:
+        with open(args.metrics_json, 'w', encoding='utf-8') as f:
+            json.dump(metrics.summary(), f, indent=2)
+    if server is not None:
+        server.shutdown()
+    return 0
@@ -0,0 +1,107 @@
+"""Bounded-concurrency helpers for running per-URL work on a thread pool."""
+
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+def host_key(url):
+    """Group profile URLs by domain so www./uk./de. share one cap.
+
+    Only meant for site URLs such as linkedin.com profiles; IP addresses
+    are kept whole. HTTP endpoints are keyed with endpoint_key instead.
+    """
+    host = urlparse(str(url)).hostname or ''
+    if host.replace('.', '').isdigit() or ':' in host:
+        return host
+    parts = [p for p in host.split('.') if p]
+    return '.'.join(parts[-2:]) if parts else ''
+
+
+def endpoint_key(url):
+    """Group requests by the full netloc (host and port) they are sent to."""
+    return urlparse(str(url)).netloc.lower().rsplit('@', 1)[-1]
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host."""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._sems = defaultdict(lambda: threading.BoundedSemaphore(self.per_host))
+
+    @contextmanager
+    def slot(self, host):
+        if not self.per_host:
+            yield
+            return
+        with self._lock:
+            sem = self._sems[host]
+        with sem:
+            yield
+
+
+def imap_ordered(func, items, max_workers=1, per_host_limit=None, key=host_key, update_cb=None):
+    """Yield func(item) for every item, in input order.
+
+    With max_workers > 1 the calls run on a thread pool, at most
+    per_host_limit at a time for any one key(item). update_cb(current, total)
+    is always called from the calling thread, once per completed item, so
+    Streamlit widgets can be updated from it safely.
+    """
+    items = list(items)
+    total = len(items)
+
+    if max_workers <= 1:
+        for i, item in enumerate(items):
+            if update_cb:
+                update_cb(i + 1, total)
+            yield func(item)
+        return
+
+    limiter = HostLimiter(per_host_limit)
+
+    def run(item):
+        with limiter.slot(key(item)):
+            return func(item)
+
+    # Keep a bounded window of submitted work so huge batches don't queue
+    # every future up front; results are released strictly in input order.
+    window = max_workers * 4
+    done_count = 0
+    next_submit = 0
+    next_yield = 0
+    futures = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        try:
+            while next_yield < total:
+                while next_submit < total and next_submit - next_yield < window:
+                    futures[next_submit] = pool.submit(run, items[next_submit])
+                    next_submit += 1
+
+                head = futures[next_yield]
+                if not head.done():
+                    pending = [f for f in futures.values() if not f.done()]
+                    wait(pending, return_when=FIRST_COMPLETED)
+
+                finished = sum(1 for f in futures.values() if f.done())
+                while done_count < finished + next_yield:
+                    done_count += 1
+                    if update_cb:
+                        update_cb(done_count, total)
+
+                while next_yield < total and next_yield in futures and futures[next_yield].done():
+                    result = futures.pop(next_yield).result()
+                    next_yield += 1
+                    yield result
+        finally:
+            for f in futures.values():
+                f.cancel()
+
+
+def map_ordered(func, items, max_workers=1, per_host_limit=None, key=host_key, update_cb=None):
+    """List form of imap_ordered."""
+    return list(imap_ordered(func, items, max_workers, per_host_limit, key, update_cb))
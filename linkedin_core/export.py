@@ -0,0 +1,205 @@
+"""Incremental export of result frames to CSV, NDJSON, JSON, Excel, Parquet and Feather.
+
+Every writer consumes an iterable of DataFrame chunks and writes each one
+as it arrives, so exporting never needs a second, serialized copy of the
+whole result in memory. Parquet and Feather need pyarrow and are only
+offered by available_formats() when it is installed.
+"""
+
+import gzip
+import importlib.util
+import io
+import math
+import tempfile
+
+import pandas as pd
+
+# format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'ndjson': ('.ndjson', 'application/x-ndjson'),
+    'json': ('.json', 'application/json'),
+    'excel': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'feather': ('.feather', 'application/vnd.apache.arrow.file'),
+}
+TEXT_FORMATS = ('csv', 'ndjson', 'json')
+ARROW_FORMATS = ('parquet', 'feather')
+EXCEL_MAX_ROWS = 1_048_576
+
+
+def available_formats():
+    """Export formats usable in this environment."""
+    have_arrow = importlib.util.find_spec('pyarrow') is not None
+    return [fmt for fmt in EXPORT_FORMATS if have_arrow or fmt not in ARROW_FORMATS]
+
+
+def export_filename(stem, fmt, compress=False):
+    extension, _ = EXPORT_FORMATS[fmt]
+    return stem + extension + ('.gz' if compress and fmt in TEXT_FORMATS else '')
+
+
+def export_mime(fmt, compress=False):
+    return 'application/gzip' if compress and fmt in TEXT_FORMATS else EXPORT_FORMATS[fmt][1]
+
+
+def iter_chunks(df, chunk_rows=50_000):
+    """Slice one DataFrame into row chunks (views, not copies of the data)."""
+    if not len(df):
+        yield df
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_record_chunks(records, chunk_rows=10_000, exclude=()):
+    """DataFrame chunks over a list of dicts (e.g. detailed profiles), minus excluded keys."""
+    for start in range(0, len(records), chunk_rows):
+        chunk = pd.DataFrame(records[start:start + chunk_rows])
+        yield chunk.drop(columns=[c for c in exclude if c in chunk.columns])
+
+
+def write_export(frames, dest, fmt, compress=False, metrics=None):
+    """Write DataFrame chunks to dest (a path or binary file); returns rows written.
+
+    frames may be a single DataFrame or any iterable of them, such as the
+    batches from iter_process_urls. compress gzips the text formats;
+    Parquet uses gzip as its column codec instead. With a Metrics
+    collector, time spent writing is recorded as the 'export' stage.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}")
+    if compress and fmt not in TEXT_FORMATS + ('parquet',):
+        raise ValueError(f"gzip compression is not supported for {fmt}")
+    if isinstance(frames, pd.DataFrame):
+        frames = iter_chunks(frames)
+    if metrics is not None:
+        frames = _timed_chunks(frames, metrics)
+
+    owns_file = isinstance(dest, str)
+    raw = open(dest, 'wb') if owns_file else dest
+    try:
+        if fmt in TEXT_FORMATS:
+            return _write_text(frames, raw, fmt, compress)
+        if fmt == 'excel':
+            return _write_excel(frames, raw)
+        return _write_arrow(frames, raw, fmt, compress)
+    finally:
+        if owns_file:
+            raw.close()
+
+
+def spool_export(frames, fmt, compress=False, metrics=None):
+    """Export into an anonymous temporary file and return it rewound, e.g. for a download."""
+    f = tempfile.TemporaryFile()
+    write_export(frames, f, fmt, compress, metrics)
+    f.seek(0)
+    return f
+
+
+def _timed_chunks(frames, metrics):
+    # Only the writing of each chunk is timed, not producing it
+    for chunk in frames:
+        with metrics.stage('export'):
+            yield chunk
+
+
+def _records_json(chunk, lines=False):
+    # pandas writes every '/' as '\/'; no other JSON escape ends in '/', so undoing it is safe
+    text = chunk.to_json(orient='records', lines=lines, date_format='iso', force_ascii=False)
+    return text.replace('\\/', '/')
+
+
+def _write_text(frames, raw, fmt, compress):
+    binary = gzip.GzipFile(fileobj=raw, mode='wb') if compress else raw
+    out = io.TextIOWrapper(binary, encoding='utf-8', newline='')
+    rows = 0
+    try:
+        if fmt == 'json':
+            out.write('[')
+        header = True
+        for chunk in frames:
+            if fmt == 'csv':
+                # An empty first chunk still writes the header line
+                chunk.to_csv(out, header=header, index=False)
+                header = False
+            elif not len(chunk):
+                continue
+            elif fmt == 'ndjson':
+                text = _records_json(chunk, lines=True)
+                out.write(text if text.endswith('\n') else text + '\n')
+            else:
+                out.write((',' if rows else '') + _records_json(chunk)[1:-1])
+            rows += len(chunk)
+        if fmt == 'json':
+            out.write(']')
+        out.flush()
+    finally:
+        # Leave dest open for the caller; only our own wrappers are closed
+        out.detach()
+        if compress:
+            binary.close()
+    return rows
+
+
+def _cell(value):
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (list, dict)):
+        return str(value)
+    return value
+
+
+def _write_excel(frames, raw):
+    import xlsxwriter
+
+    # constant_memory streams each row to a temp file as soon as it is written;
+    # profile URLs stay plain strings (hyperlinks are slow and capped per sheet)
+    workbook = xlsxwriter.Workbook(raw, {'constant_memory': True, 'strings_to_urls': False})
+    worksheet = None
+    header = None
+    row = 0
+    rows = 0
+    try:
+        for chunk in frames:
+            if header is None:
+                header = list(chunk.columns)
+            for values in chunk.itertuples(index=False, name=None):
+                # Results beyond one sheet's row limit continue on the next sheet
+                if worksheet is None or row == EXCEL_MAX_ROWS:
+                    worksheet = workbook.add_worksheet(f"Results {len(workbook.worksheets()) + 1}"
+                                                       if workbook.worksheets() else 'Results')
+                    worksheet.write_row(0, 0, header)
+                    row = 1
+                worksheet.write_row(row, 0, [_cell(v) for v in values])
+                row += 1
+            rows += len(chunk)
+        if worksheet is None:
+            worksheet = workbook.add_worksheet('Results')
+            if header is not None:
+                worksheet.write_row(0, 0, header)
+    finally:
+        workbook.close()
+    return rows
+
+
+def _write_arrow(frames, raw, fmt, compress):
+    import pyarrow as pa
+
+    writer = None
+    rows = 0
+    try:
+        for chunk in frames:
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                if fmt == 'parquet':
+                    import pyarrow.parquet as pq
+                    writer = pq.ParquetWriter(raw, schema, compression='gzip' if compress else 'snappy')
+                else:
+                    writer = pa.ipc.new_file(raw, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
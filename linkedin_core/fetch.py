@@ -0,0 +1,217 @@
+"""HTTP fetching on a pooled requests.Session, with retries and a circuit breaker."""
+
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .concurrency import endpoint_key
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class FetchError(Exception):
+    """A URL could not be fetched after all retries."""
+
+
+class CircuitOpenError(FetchError):
+    """The host is paused after repeated failures; nothing was sent."""
+
+
+class CircuitBreaker:
+    """Pause a host after failure_threshold consecutive failures.
+
+    While open, allow() refuses the host until reset_timeout has passed;
+    then a single trial request is let through (half-open). Its success
+    closes the circuit, its failure opens it for another reset_timeout.
+    wait() blocks until the host is allowed again instead of refusing,
+    unless the host has been down (open, with every probe failing) for
+    longer than its timeout; then it gives up at once, so a dead host
+    fails fast instead of holding every remaining request for a probe.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = {}
+        self._opened = {}
+        self._down_since = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock'], state['_changed']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def _admit(self, host):
+        # Returns 0 when host may send, else the seconds until it is reconsidered
+        opened = self._opened.get(host)
+        if opened is None:
+            return 0
+        remaining = opened + self.reset_timeout - time.monotonic()
+        if remaining > 0:
+            return remaining
+        # Half-open: let this caller probe, keep others out until it reports
+        self._opened[host] = time.monotonic()
+        return 0
+
+    def allow(self, host):
+        with self._lock:
+            return not self._admit(host)
+
+    def wait(self, host, timeout=None):
+        """Block until host is allowed (True); False once it has been down for timeout seconds."""
+        with self._changed:
+            while True:
+                delay = self._admit(host)
+                if not delay:
+                    return True
+                if timeout is not None:
+                    remaining = self._down_since[host] + timeout - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    delay = min(delay, remaining)
+                # A probe's outcome wakes the waiters early
+                self._changed.wait(delay)
+
+    def record_success(self, host):
+        with self._changed:
+            self._failures.pop(host, None)
+            self._opened.pop(host, None)
+            self._down_since.pop(host, None)
+            self._changed.notify_all()
+
+    def record_failure(self, host):
+        with self._changed:
+            failures = self._failures[host] = self._failures.get(host, 0) + 1
+            if failures >= self.failure_threshold or host in self._opened:
+                self._opened[host] = time.monotonic()
+                self._down_since.setdefault(host, self._opened[host])
+            self._changed.notify_all()
+
+    def is_open(self, host):
+        with self._lock:
+            return host in self._opened
+
+
+def retry_after(response):
+    """Seconds from a Retry-After header, or None if absent or an HTTP date."""
+    value = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _json(url, response):
+    # A 200 that is not JSON (a maintenance page, a truncated body) is a failed fetch
+    try:
+        return response.json()
+    except ValueError as e:
+        raise FetchError(f"GET {url}: response is not JSON: {e}") from e
+
+
+class HttpFetcher:
+    """GET with pooled keep-alive connections, timeouts, retries and a circuit breaker.
+
+    Mounts an HTTPAdapter sized for pool_size concurrent connections per
+    host on session. Connection errors, timeouts and RETRY_STATUSES are
+    retried up to max_retries times with full-jitter exponential backoff
+    (a Retry-After header, when present, is honoured instead); every failed
+    attempt counts towards the host's circuit breaker. While the breaker
+    is open, requests wait for it rather than fail, so a struggling host
+    is paused, not skipped. get() raises FetchError when retries run out,
+    and CircuitOpenError once the host has been down for more than
+    breaker_wait seconds (None waits as long as it takes).
+
+    With a RateLimiter, every attempt first waits for a token; a 429 then
+    slows the host down through the limiter (which also honours
+    Retry-After) instead of tripping the breaker, and successes speed it
+    back up.
+    """
+
+    def __init__(self, session=None, pool_size=16, connect_timeout=3.05, read_timeout=10.0,
+                 max_retries=3, backoff_base=0.5, backoff_max=30.0, breaker=None, limiter=None, key=endpoint_key,
+                 breaker_wait=120.0):
+        self.session = session if session is not None else requests.Session()
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.limiter = limiter
+        self.key = key
+        self.breaker_wait = breaker_wait
+        self.pool_size = 0
+        self.size_pool(pool_size)
+
+    def size_pool(self, pool_size):
+        """Make sure pool_size keep-alive connections per host can be reused concurrently."""
+        if pool_size <= self.pool_size:
+            return
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.pool_size = pool_size
+
+    def backoff(self, attempt, response=None):
+        """Seconds to wait before retry number attempt (0-based)."""
+        delay = retry_after(response)
+        if delay is not None:
+            return min(self.backoff_max, delay)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def get(self, url, **kwargs):
+        host = self.key(url)
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.wait(host, self.breaker_wait):
+                raise CircuitOpenError(f"circuit open for {host}")
+            if self.limiter is not None:
+                self.limiter.acquire(url)
+            response = None
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException as e:
+                # Connection errors and timeouts, but also bodies cut short or undecodable
+                error = e
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success(host)
+                    if self.limiter is not None:
+                        self.limiter.reward(url)
+                    return response
+                error = f"HTTP {response.status_code}"
+                if response.status_code == 429 and self.limiter is not None:
+                    # Throttling, not failure: the limiter's slowdown is the backoff
+                    self.limiter.penalize(url, retry_after(response))
+                    continue
+            self.breaker.record_failure(host)
+            if attempt < self.max_retries:
+                time.sleep(self.backoff(attempt, response))
+        raise FetchError(f"GET {url} failed after {self.max_retries + 1} attempts: {error}")
+
+    def get_json(self, url, **kwargs):
+        response = self.get(url, **kwargs)
+        if not response.ok:
+            raise FetchError(f"GET {url}: HTTP {response.status_code}")
+        return _json(url, response)
+
+    def get_json_if_changed(self, url, etag=None, **kwargs):
+        """Conditional GET: (data, etag), or (None, etag) when the server answers 304 Not Modified."""
+        if etag:
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'If-None-Match': etag}
+        response = self.get(url, **kwargs)
+        if response.status_code == 304:
+            return None, response.headers.get('ETag', etag)
+        if not response.ok:
+            raise FetchError(f"GET {url}: HTTP {response.status_code}")
+        return _json(url, response), response.headers.get('ETag')
@@ -0,0 +1,69 @@
+"""Column-pruned, chunked reading of uploaded CSV/XLSX URL lists."""
+
+import pandas as pd
+
+
+def _is_excel(name):
+    return not str(name).lower().endswith('csv')
+
+
+def read_header(file, name):
+    """Return the column names of an uploaded CSV/XLSX without loading its rows."""
+    file.seek(0)
+    if not _is_excel(name):
+        return list(pd.read_csv(file, nrows=0).columns)
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file, read_only=True)
+    try:
+        header = next(wb.active.iter_rows(max_row=1, values_only=True), ())
+    finally:
+        wb.close()
+    return [str(v) if v is not None else f"Unnamed: {i}" for i, v in enumerate(header)]
+
+
+def iter_url_chunks(file, name, column, chunksize=10_000):
+    """Yield lists of non-empty values from one column, chunksize rows at a time.
+
+    CSVs are parsed with only the chosen column kept; .xlsx files are read
+    in openpyxl's read-only streaming mode, so peak memory follows the
+    chunk size rather than the file size.
+    """
+    file.seek(0)
+    if not _is_excel(name):
+        reader = pd.read_csv(file, usecols=[column], dtype=str, chunksize=chunksize)
+        for chunk in reader:
+            values = chunk[column].dropna()
+            values = values[values.str.strip() != '']
+            if len(values):
+                yield values.tolist()
+        return
+
+    from openpyxl import load_workbook
+
+    col = read_header(file, name).index(column)
+    file.seek(0)
+    wb = load_workbook(file, read_only=True)
+    try:
+        chunk = []
+        for row in wb.active.iter_rows(min_row=2, min_col=col + 1, max_col=col + 1, values_only=True):
+            value = row[0] if row else None
+            if value is None or str(value).strip() == '':
+                continue
+            chunk.append(value)
+            if len(chunk) >= chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        wb.close()
+
+
+def load_urls(file, name, column, chunksize=10_000):
+    """Read one URL column from an upload, chunk by chunk, into a flat list."""
+    urls = []
+    for chunk in iter_url_chunks(file, name, column, chunksize):
+        urls.extend(chunk)
+    return urls
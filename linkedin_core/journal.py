@@ -0,0 +1,86 @@
+"""Append-only checkpoint journal for resumable extraction jobs."""
+
+import json
+import os
+import threading
+
+
+def job_id(scraper, key, session=None):
+    """Journal id for one scraper type, caller session and input key.
+
+    Journals hold that scraper's row tuples, so sessions of other apps or
+    tabs extracting the same URLs must not share (or remove) the file.
+    """
+    parts = [type(scraper).__name__] + ([session] if session else []) + [key]
+    return '-'.join(parts)
+
+
+class JobJournal:
+    """Records each completed profile of a job as one JSON line.
+
+    Reopening a journal with the same job_id replays the completed entries,
+    so wrap(process_url) skips every URL already done and only extracts the
+    rest. A line cut short by a crash is truncated away on reopen.
+    """
+
+    def __init__(self, job_id, directory='.jobs'):
+        self.job_id = job_id
+        self.path = os.path.join(directory, f"{job_id}.jsonl")
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._done = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'rb+') as f:
+                complete = 0
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Cut the partial line off, or the next record would be glued onto it
+                        f.truncate(complete)
+                        break
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    item = entry['item']
+                    self._done[entry['url']] = tuple(item) if isinstance(item, list) else item
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def __len__(self):
+        return len(self._done)
+
+    def __contains__(self, url):
+        return url in self._done
+
+    def get(self, url):
+        return self._done.get(url)
+
+    def record(self, url, item):
+        line = json.dumps({'url': url, 'item': item}) + '\n'
+        with self._lock:
+            self._done[url] = item
+            self._file.write(line)
+            self._file.flush()
+
+    def wrap(self, func):
+        """Return func(url), served from the journal when the URL is already done."""
+        def journaled(url):
+            if url in self._done:
+                return self._done[url]
+            item = func(url)
+            # None (a failed fetch) is not checkpointed, so a resumed job retries it
+            if item is not None:
+                self.record(url, item)
+            return item
+        return journaled
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def remove(self):
+        """Close and delete the journal once the job has finished."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,190 @@
+"""Per-stage timing, latency histograms and a Prometheus text endpoint."""
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+    """Thread-safe collector for extraction runs.
+
+    stage(name) accumulates wall time per pipeline stage, observe_latency()
+    feeds the per-URL latency histogram and incr() bumps named counters
+    (rows, profiles, cache hits/misses). Values are cumulative for the
+    life of the object, as Prometheus expects; summary() derives the
+    ratios and throughput from them.
+    """
+
+    def __init__(self, prefix='linkedin'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self):
+        # Scrapers are pickled into worker processes for sharded runs; the
+        # lock is recreated there and the worker's copy counts separately
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.stage_seconds = {}
+            self.stage_calls = {}
+            self.counters = {}
+            self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.latency_sum = 0.0
+            self.latency_count = 0
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - start)
+
+    def add_stage(self, name, seconds):
+        with self._lock:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe_latency(self, seconds):
+        with self._lock:
+            self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.latency_sum += seconds
+            self.latency_count += 1
+
+    def merge(self, other):
+        """Add another collector's totals into this one, e.g. a run into the process totals."""
+        with other._lock:
+            stage_seconds, stage_calls = dict(other.stage_seconds), dict(other.stage_calls)
+            counters, buckets = dict(other.counters), list(other.bucket_counts)
+            latency_sum, latency_count = other.latency_sum, other.latency_count
+        with self._lock:
+            for name, seconds in stage_seconds.items():
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+                self.stage_calls[name] = self.stage_calls.get(name, 0) + stage_calls[name]
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            self.bucket_counts = [a + b for a, b in zip(self.bucket_counts, buckets)]
+            self.latency_sum += latency_sum
+            self.latency_count += latency_count
+
+    def timed(self, func, stage='fetch'):
+        """Wrap func so each call is timed as a stage and a latency sample."""
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.add_stage(stage, elapsed)
+                self.observe_latency(elapsed)
+        return wrapper
+
+    def _quantile(self, q):
+        if not self.latency_count:
+            return None
+        target = q * self.latency_count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), self.bucket_counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float('inf')
+
+    def summary(self):
+        """Structured snapshot: stage times, latency histogram, cache ratio, rows/sec."""
+        with self._lock:
+            hits = self.counters.get('cache_hits', 0)
+            misses = self.counters.get('cache_misses', 0)
+            run_seconds = self.stage_seconds.get('run', 0.0)
+            rows = self.counters.get('rows', 0)
+            return {
+                'stages': {
+                    name: {'seconds': secs, 'calls': self.stage_calls[name]}
+                    for name, secs in self.stage_seconds.items()
+                },
+                'counters': dict(self.counters),
+                'latency': {
+                    'count': self.latency_count,
+                    'mean': self.latency_sum / self.latency_count if self.latency_count else None,
+                    'p50_le': self._quantile(0.5),
+                    'p95_le': self._quantile(0.95),
+                    'p99_le': self._quantile(0.99),
+                    'buckets': dict(zip([str(b) for b in LATENCY_BUCKETS] + ['+Inf'], self.bucket_counts)),
+                },
+                'cache_hit_ratio': hits / (hits + misses) if hits + misses else None,
+                'rows_per_second': rows / run_seconds if run_seconds else None,
+            }
+
+    def to_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        summary = self.summary()
+        lines = [f"# TYPE {p}_stage_seconds_total counter"]
+        for name, stage in summary['stages'].items():
+            lines.append(f'{p}_stage_seconds_total{{stage="{name}"}} {stage["seconds"]}')
+        lines.append(f"# TYPE {p}_stage_calls_total counter")
+        for name, stage in summary['stages'].items():
+            lines.append(f'{p}_stage_calls_total{{stage="{name}"}} {stage["calls"]}')
+        for name, value in summary['counters'].items():
+            lines.append(f"# TYPE {p}_{name}_total counter")
+            lines.append(f"{p}_{name}_total {value}")
+
+        lines.append(f"# TYPE {p}_url_latency_seconds histogram")
+        with self._lock:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), self.bucket_counts):
+                cumulative += count
+                lines.append(f'{p}_url_latency_seconds_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"{p}_url_latency_seconds_sum {self.latency_sum}")
+            lines.append(f"{p}_url_latency_seconds_count {self.latency_count}")
+
+        for gauge in ('cache_hit_ratio', 'rows_per_second'):
+            if summary[gauge] is not None:
+                lines.append(f"# TYPE {p}_{gauge} gauge")
+                lines.append(f"{p}_{gauge} {summary[gauge]}")
+        return '\n'.join(lines) + '\n'
+
+
+def start_metrics_server(metrics, port=9108, host='127.0.0.1'):
+    """Serve /metrics (Prometheus text) and /metrics.json from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/metrics':
+                body = metrics.to_prometheus().encode()
+                content_type = 'text/plain; version=0.0.4'
+            elif self.path == '/metrics.json':
+                body = json.dumps(metrics.summary()).encode()
+                content_type = 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,114 @@
+"""Coalesced progress events with rolling throughput and ETA."""
+
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+
+class ProgressEvent(namedtuple('ProgressEvent', 'processed total valid invalid cached elapsed rate eta done')):
+    """Snapshot of a run; rate is profiles/sec over the rolling window, eta in seconds or None."""
+
+    __slots__ = ()
+
+    def describe(self):
+        parts = [f"{self.processed} of {self.total} profiles"]
+        if self.invalid:
+            parts.append(f"{self.invalid} invalid")
+        if self.cached:
+            parts.append(f"{self.cached} cached")
+        parts.append(f"{self.rate:.1f}/s")
+        if self.eta is not None and not self.done:
+            minutes, seconds = divmod(int(self.eta + 0.5), 60)
+            parts.append(f"ETA {minutes}m{seconds:02d}s" if minutes else f"ETA {seconds}s")
+        return ' · '.join(parts)
+
+
+class ProgressStream:
+    """Count processed items and publish a ProgressEvent at most once per interval.
+
+    update() is called once per item from the thread driving the run and
+    only does a few additions and a clock read unless an event is due.
+    Callback subscribers run on that thread, so they must be quick (a
+    Streamlit widget update is fine); slower consumers should use
+    subscribe_queue(), which always holds just the latest event and never
+    blocks the producer. The final event (done=True) is always delivered.
+    """
+
+    def __init__(self, interval=0.5, window=10.0):
+        self.interval = interval
+        self.window = window
+        self._callbacks = []
+        self._queues = []
+        self._lock = threading.Lock()
+        self.latest = None
+        self.start(0)
+
+    def subscribe(self, callback):
+        self._callbacks.append(callback)
+        return callback
+
+    def subscribe_queue(self):
+        q = queue.Queue(maxsize=1)
+        with self._lock:
+            self._queues.append(q)
+        return q
+
+    def start(self, total, invalid=0):
+        """Reset for a run of total items, of which invalid were rejected before processing."""
+        self.total = total
+        self.processed = invalid
+        self.valid = self.cached = 0
+        self._started = time.monotonic()
+        self._next_emit = self._started
+        self._samples = deque([(self._started, invalid)])
+
+    def update(self, valid=True, cached=None):
+        """Count one processed item; cached is the running total of items served without extraction."""
+        self.processed += 1
+        if valid:
+            self.valid += 1
+        if cached is not None:
+            self.cached = min(cached, self.processed)
+        now = time.monotonic()
+        if now >= self._next_emit:
+            self._next_emit = now + self.interval
+            self._emit(now, done=False)
+
+    def finish(self):
+        self._emit(time.monotonic(), done=True)
+
+    def _emit(self, now, done):
+        samples = self._samples
+        samples.append((now, self.processed))
+        while len(samples) > 2 and samples[0][0] < now - self.window:
+            samples.popleft()
+        since, processed_then = samples[0]
+        rate = (self.processed - processed_then) / (now - since) if now > since else 0.0
+        remaining = self.total - self.processed
+        event = ProgressEvent(
+            processed=self.processed,
+            total=self.total,
+            valid=self.valid,
+            invalid=self.processed - self.valid,
+            cached=self.cached,
+            elapsed=now - self._started,
+            rate=rate,
+            eta=remaining / rate if rate else None,
+            done=done,
+        )
+        self.latest = event
+        for callback in self._callbacks:
+            callback(event)
+        with self._lock:
+            queues = list(self._queues)
+        for q in queues:
+            # Latest event wins: drop the stale one rather than wait for the consumer
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                pass
@@ -0,0 +1,146 @@
+"""Adaptive per-host token-bucket rate limiting, shared across a process."""
+
+import asyncio
+import threading
+import time
+
+from .concurrency import endpoint_key
+
+
+class _Bucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.successes = 0
+
+    def refill(self, now, burst):
+        if now > self.updated:
+            self.tokens = min(burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+
+class RateLimiter:
+    """Token bucket per host: rate requests/sec on average, bursts of up to burst.
+
+    Each host starts at rate. penalize() (a 429) halves the host's rate,
+    down to min_rate, and with a Retry-After also pauses the host for that
+    long; reward() (a success) raises it by rate_step after every
+    success_window consecutive successes, up to max_rate (unbounded if
+    None), so the limiter settles just under what the upstream accepts.
+    """
+
+    def __init__(self, rate=8.0, burst=16, min_rate=0.1, max_rate=None, rate_step=None,
+                 decrease=0.5, success_window=20, key=endpoint_key):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_step = rate_step if rate_step is not None else rate / 10
+        self.decrease = decrease
+        self.success_window = success_window
+        self.key = key
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def __reduce_ex__(self, protocol):
+        # The process-wide limiter maps to the receiving process's own one
+        if self is _shared:
+            return shared_rate_limiter, ()
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.rate, self.burst)
+        return bucket
+
+    def _take(self, host):
+        # Returns 0 when a token was taken, else the seconds until one is due
+        now = time.monotonic()
+        bucket = self._bucket(host)
+        bucket.refill(now, self.burst)
+        if now < bucket.paused_until:
+            return bucket.paused_until - now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0
+        return (1 - bucket.tokens) / bucket.rate
+
+    def acquire(self, url):
+        """Block until url's host may send another request; returns seconds waited."""
+        host = self.key(url)
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._take(host)
+            if not wait:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, url):
+        """acquire() for event loops: the wait is an asyncio.sleep, so it can be cancelled."""
+        host = self.key(url)
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._take(host)
+            if not wait:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def try_acquire(self, url):
+        """Take a token without waiting; False if the host is over its rate."""
+        with self._lock:
+            return not self._take(self.key(url))
+
+    def penalize(self, url, retry_after=None):
+        with self._lock:
+            bucket = self._bucket(self.key(url))
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+            bucket.successes = 0
+            if retry_after:
+                # Nothing goes out, and no tokens accrue, until the pause is over
+                bucket.paused_until = max(bucket.paused_until, time.monotonic() + retry_after)
+                bucket.tokens = 0
+                bucket.updated = bucket.paused_until
+
+    def reward(self, url):
+        with self._lock:
+            bucket = self._bucket(self.key(url))
+            bucket.successes += 1
+            if bucket.successes >= self.success_window:
+                bucket.successes = 0
+                bucket.rate += self.rate_step
+                if self.max_rate is not None:
+                    bucket.rate = min(self.max_rate, bucket.rate)
+
+    def rates(self):
+        """Current requests/sec per host."""
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter():
+    """The process-wide limiter every scraper uses unless given its own."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter()
+        return _shared
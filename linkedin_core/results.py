@@ -0,0 +1,64 @@
+"""Columnar accumulator for extraction results."""
+
+import numpy as np
+import pandas as pd
+
+
+class ResultBuilder:
+    """Collects profiles and their certifications straight into column lists.
+
+    Each add() appends one value per column instead of copying a row dict
+    per certification. to_frame() builds the classic one-row-per-cert table
+    in one step; to_tables() returns a normalized (profiles, certifications)
+    pair linked by profile_id.
+    """
+
+    def __init__(self, profile_columns, cert_columns):
+        self.profile_columns = list(profile_columns)
+        self.cert_columns = list(cert_columns)
+        self._profiles = {c: [] for c in self.profile_columns}
+        self._certs = {c: [] for c in self.cert_columns}
+        self._row_profile = []
+        self._has_cert = []
+
+    def __len__(self):
+        return len(self._row_profile)
+
+    @property
+    def profile_count(self):
+        return len(self._profiles[self.profile_columns[0]]) if self.profile_columns else 0
+
+    def add(self, base, certs):
+        """Append one profile (a dict of profile columns) and its cert dicts."""
+        profile_id = self.profile_count
+        for c in self.profile_columns:
+            self._profiles[c].append(base[c])
+        if not certs:
+            for c in self.cert_columns:
+                self._certs[c].append('')
+            self._row_profile.append(profile_id)
+            self._has_cert.append(False)
+            return
+        for cert in certs:
+            for c in self.cert_columns:
+                self._certs[c].append(cert[c])
+            self._row_profile.append(profile_id)
+            self._has_cert.append(True)
+
+    def to_frame(self):
+        """One row per certification (or one blank-cert row per uncertified profile)."""
+        profiles = pd.DataFrame(self._profiles, columns=self.profile_columns)
+        rows = np.asarray(self._row_profile, dtype=np.intp)
+        frame = profiles.take(rows).reset_index(drop=True)
+        for c in self.cert_columns:
+            frame[c] = self._certs[c]
+        return frame
+
+    def to_tables(self):
+        """Return (profiles, certifications) frames linked by profile_id."""
+        profiles = pd.DataFrame(self._profiles, columns=self.profile_columns)
+        profiles.insert(0, 'profile_id', np.arange(len(profiles)))
+        certs = pd.DataFrame(self._certs, columns=self.cert_columns)
+        certs.insert(0, 'profile_id', np.asarray(self._row_profile, dtype=np.int64))
+        certs = certs[np.asarray(self._has_cert, dtype=bool)].reset_index(drop=True)
+        return profiles, certs
@@ -0,0 +1,469 @@
+"""LinkedIn profile scrapers, usable without Streamlit.
+
+LinkedInScraper backs the basic apps (linkedin_model.py, linkedin_down.py);
+EnhancedLinkedInScraper backs the Pro app with detailed profiles.
+"""
+
+import random
+from datetime import datetime
+from urllib.parse import urlparse
+
+import requests
+
+from .aio import aget_profile, aiter_extracted
+from .certs import BASIC_CERTIFICATIONS, CERTIFICATION_CATALOG
+from .classify import HRClassifier
+from .concurrency import imap_ordered
+from .fetch import FetchError, HttpFetcher
+from .metrics import Metrics
+from .ratelimit import shared_rate_limiter
+from .results import ResultBuilder
+from .sharding import imap_sharded
+from .urls import UrlIndex, profile_digest, profile_endpoint
+
+
+class BaseScraper:
+    """Extraction pipeline shared by both scrapers.
+
+    Subclasses define the result columns, the certification catalog and
+    default keywords, generate_profile(url) for simulated profiles and
+    _rows(url, data) to turn a profile into (base, certs[, ...]) rows.
+    """
+
+    profile_columns = []
+    cert_columns = []
+    hr_certifications = {}
+    default_hr_keywords = []
+
+    def __init__(self, cache=None, simulate_delay=True, metrics=None, endpoint=None, rate_limiter=None):
+        self.cache = cache
+        self.simulate_delay = simulate_delay
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        # With an endpoint template (e.g. http://127.0.0.1:8000/in/{slug}) profiles
+        # are fetched as JSON over the pooled session instead of simulated
+        self.endpoint = endpoint
+        # One token bucket per host, shared by every scraper and worker thread in the process
+        self.rate_limiter = rate_limiter if rate_limiter is not None else shared_rate_limiter()
+        self.fetcher = HttpFetcher(self.session, limiter=self.rate_limiter)
+        self.hr_keywords = list(self.default_hr_keywords)
+        self.hr_classifier = HRClassifier(self.hr_keywords)
+
+    def is_valid_linkedin_url(self, url):
+        parsed = urlparse(url)
+        return 'linkedin.com' in parsed.netloc and '/in/' in parsed.path
+
+    def is_hr_related(self, title, dept):
+        return self.hr_classifier(title, dept)
+
+    def generate_profile(self, url):
+        raise NotImplementedError
+
+    def _rows(self, url, data):
+        raise NotImplementedError
+
+    def fetch_profile(self, url):
+        if self.endpoint:
+            return self.fetcher.get_json(profile_endpoint(self.endpoint, url))
+        # Pace simulated fetches like real ones, speeding up on success
+        if self.simulate_delay:
+            self.rate_limiter.acquire(url)
+        data = self.generate_profile(url)
+        if self.simulate_delay:
+            self.rate_limiter.reward(url)
+        return data
+
+    def get_profile(self, url):
+        """Serve the profile from the on-disk cache when available"""
+        if self.cache is None:
+            return self.fetch_profile(url)
+        return self._cached(url, self.fetch_profile)
+
+    def fetch_if_changed(self, url, etag=None):
+        """(profile, etag) for incremental refreshes; profile is None when the endpoint answers 304"""
+        if self.endpoint:
+            return self.fetcher.get_json_if_changed(profile_endpoint(self.endpoint, url), etag)
+        return self.fetch_profile(url), None
+
+    def _cached(self, url, factory):
+        if self.cache.refresh_age is not None:
+            # Fresh, unchanged and (when revalidation fails) stale profiles are carried forward from the cache
+            data, outcome = self.cache.refresh(url, self.fetch_if_changed)
+            self.metrics.incr(f'refresh_{outcome}')
+            self.metrics.incr('cache_hits' if outcome in ('fresh', 'unchanged', 'stale') else 'cache_misses')
+            return data
+        data = self.cache.get(url)
+        if data is None:
+            self.metrics.incr('cache_misses')
+            data = factory(url)
+            self.cache.put(url, data)
+        else:
+            self.metrics.incr('cache_hits')
+        return data
+
+    def process_url(self, url):
+        """Extract one URL into rows, or None for invalid URLs and failed fetches"""
+        if not self.is_valid_linkedin_url(url):
+            return None
+        try:
+            data = self.get_profile(url)
+        except FetchError:
+            self.metrics.incr('fetch_errors')
+            return None
+        return self._profile_rows(url, data)
+
+    async def aextract_profile(self, url, executor=None):
+        """Async process_url: waits are awaited and blocking I/O runs on executor"""
+        if not self.is_valid_linkedin_url(url):
+            return None
+        try:
+            data = await aget_profile(self, url, self.generate_profile, executor)
+        except FetchError:
+            self.metrics.incr('fetch_errors')
+            return None
+        return self._profile_rows(url, data)
+
+    def _profile_rows(self, url, data):
+        # A body missing the fields _rows reads fails that profile, not the run
+        try:
+            return self._rows(url, data)
+        except (KeyError, TypeError):
+            self.metrics.incr('fetch_errors')
+            return None
+
+    def aprocess_urls(self, urls, concurrency=64, progress=None):
+        """Async iterator of (url, rows or None) per distinct profile, as each completes"""
+        return aiter_extracted(self, urls, concurrency, progress)
+
+    def new_result_builder(self):
+        return ResultBuilder(self.profile_columns, self.cert_columns)
+
+    def _expand(self, builder, base, certs):
+        with self.metrics.stage('row_expansion'):
+            builder.add(base, certs)
+        self.metrics.incr('rows', len(certs) or 1)
+
+    def _build(self, builder, normalized=False):
+        with self.metrics.stage('dataframe_build'):
+            return builder.to_tables() if normalized else builder.to_frame()
+
+    def offline_copy(self):
+        """Cache-less, delay-free scraper of the same type, for worker processes"""
+        return type(self)(simulate_delay=False)
+
+    def _extract_unique(self, urls, update_cb, max_workers, per_host_limit, journal, processes):
+        if processes:
+            if journal is not None or self.cache is not None or self.endpoint:
+                raise ValueError("processes only shard simulated generation; use threads with a cache, endpoint or journal")
+            return imap_sharded(self.offline_copy().process_url, urls, processes, update_cb=update_cb)
+        self.fetcher.size_pool(max_workers)
+        # Only real extractions are timed; journal replays skip the wrapper
+        process = self.metrics.timed(self.process_url)
+        if journal is not None:
+            process = journal.wrap(process)
+        return imap_ordered(process, urls, max_workers, per_host_limit, update_cb=update_cb)
+
+    def _track_progress(self, index, extracted, progress, journal):
+        # Fed from the calling thread, one update per distinct profile; rows that
+        # are not profile URLs count as invalid up front, and cache hits and
+        # journal replays count as cached
+        resumed = set() if journal is None else {url for url in index.unique if url in journal}
+        hits_before = self.metrics.counters.get('cache_hits', 0)
+        replayed = 0
+        invalid = index.invalid
+        progress.start(len(index.unique) + invalid, invalid)
+        for url, item in zip(index.unique, extracted):
+            if url in resumed:
+                replayed += 1
+            progress.update(item is not None, replayed + self.metrics.counters.get('cache_hits', 0) - hits_before)
+            yield item
+        progress.finish()
+
+    def _iter_rows(self, urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+        """Yield (item, first_seen) for every valid input URL, in input order; backs iter_extracted.
+
+        Each distinct profile is extracted once, under its canonical URL; its
+        rows fan back out to every input row, with profile_url set to that
+        row's URL as given, and first_seen marks the row where it appears first.
+        With a JobJournal, profiles already in it are replayed instead of
+        extracted again and new ones are checkpointed as they complete.
+        With processes, simulated profiles are generated across a process
+        pool of delay-free workers (see imap_sharded); they depend on their
+        URL alone, so the output matches a single-process run. The workers
+        have no cache, endpoint, rate limiter or journal, so combining
+        processes with a cache, an endpoint or a journal raises ValueError,
+        and per-profile latency is not recorded in metrics.
+        A ProgressStream, if given, gets coalesced per-profile progress events.
+        """
+        with self.metrics.stage('validation'):
+            index = UrlIndex(urls)
+        self.metrics.incr('profiles', len(index.unique))
+        extracted = self._extract_unique(index.unique, update_cb, max_workers, per_host_limit, journal, processes)
+        if progress is not None:
+            extracted = self._track_progress(index, extracted, progress, journal)
+        emitted = 0
+        for url, slot, item in index.iter_slots(extracted):
+            first_seen = slot == emitted
+            if first_seen:
+                emitted += 1
+            if item is None:
+                continue
+            # Rows keep the uploaded URL so they can be matched back to their input row
+            base = item[0]
+            if base['profile_url'] != url:
+                item = ({**base, 'profile_url': url}, *item[1:])
+            yield item, first_seen
+
+
+class LinkedInScraper(BaseScraper):
+    profile_columns = ['profile_url', 'profile_name', 'company_name', 'job_title', 'department', 'location', 'is_hr_related']
+    cert_columns = ['certification', 'provider', 'type', 'issued', 'renewal']
+    # Shared, read-only catalog rather than a per-instance copy
+    hr_certifications = BASIC_CERTIFICATIONS
+    default_hr_keywords = ['human resources', 'hr', 'talent', 'recruit', 'people', 'employee']
+
+    def extract_profile_data(self, url):
+        return self.fetch_profile(url)
+
+    def generate_profile_data(self, url):
+        # Seeded from a stable digest of the URL, so a profile is identical in every process
+        digest = profile_digest(url)
+        rng = random.Random(digest)
+        return {
+            'profile_name': f"User {digest % 1000}",
+            'company_name': f"Company {digest % 100}",
+            'job_title': rng.choice(['HR Manager', 'Recruiter', 'People Ops Lead']),
+            'department': 'HR',
+            'location': 'USA',
+            'certifications': self.generate_sample_certs(rng)
+        }
+
+    generate_profile = generate_profile_data
+
+    def generate_sample_certs(self, rng=random):
+        certs = list(self.hr_certifications.keys())
+        return [{
+            'name': c,
+            'provider': self.hr_certifications[c][0],
+            'type': self.hr_certifications[c][1],
+            'issued_date': f"{rng.randint(1,12):02d}/{rng.randint(2020,2023)}",
+            'renewal_date': f"{rng.randint(1,12):02d}/{rng.randint(2024,2026)}"
+        } for c in rng.sample(certs, rng.randint(0, len(certs)))]
+
+    def _rows(self, url, data):
+        base = {
+            'profile_url': url,
+            'profile_name': data['profile_name'],
+            'company_name': data['company_name'],
+            'job_title': data['job_title'],
+            'department': data['department'],
+            'location': data['location'],
+            'is_hr_related': self.is_hr_related(data['job_title'], data['department'])
+        }
+        certs = [{'certification': cert['name'], 'provider': cert['provider'], 'type': cert['type'], 'issued': cert['issued_date'], 'renewal': cert['renewal_date']}
+                 for cert in data['certifications']]
+        return base, certs
+
+    def iter_extracted(self, urls, update_cb=None, max_workers=1, per_host_limit=None, journal=None, processes=None, progress=None):
+        """Yield (base, certs) for every valid input URL, in input order (see _iter_rows)"""
+        for item, _ in self._iter_rows(urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+            yield item
+
+    def iter_process_urls(self, urls, update_cb=None, max_workers=1, per_host_limit=None, batch_size=50, journal=None, processes=None, progress=None):
+        """Yield DataFrame batches of result rows, in input order, as profiles complete"""
+        with self.metrics.stage('run'):
+            builder = self.new_result_builder()
+            for base, certs in self.iter_extracted(urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+                self._expand(builder, base, certs)
+                if len(builder) >= batch_size:
+                    yield self._build(builder)
+                    builder = self.new_result_builder()
+            if len(builder):
+                yield self._build(builder)
+
+    def process_urls(self, urls, update_cb=None, max_workers=1, per_host_limit=None, normalized=False, journal=None, processes=None, progress=None):
+        """Return one row per certification, or (profiles, certifications) if normalized"""
+        with self.metrics.stage('run'):
+            builder = self.new_result_builder()
+            for base, certs in self.iter_extracted(urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+                self._expand(builder, base, certs)
+            return self._build(builder, normalized)
+
+
+# Vocabulary for simulated enhanced profiles (also used by linkedin_core.synthetic)
+FIRST_NAMES = ['Sarah', 'Michael', 'Jennifer', 'David', 'Emily', 'Robert', 'Lisa', 'John', 'Jessica', 'Christopher']
+LAST_NAMES = ['Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez', 'Hernandez']
+
+COMPANIES = [
+    'Google', 'Microsoft', 'Amazon', 'Apple', 'Meta', 'Tesla', 'Netflix', 'Salesforce',
+    'Adobe', 'Oracle', 'IBM', 'Intel', 'Cisco', 'PayPal', 'Uber', 'Airbnb'
+]
+
+HR_TITLES = [
+    'Senior HR Manager', 'Talent Acquisition Specialist', 'People Operations Lead',
+    'HR Business Partner', 'Recruitment Manager', 'Employee Experience Manager',
+    'Organizational Development Specialist', 'HR Generalist', 'Talent Development Manager',
+    'Workforce Analytics Manager', 'Compensation & Benefits Specialist', 'HR Director'
+]
+
+LOCATIONS = [
+    'San Francisco, CA', 'New York, NY', 'Seattle, WA', 'Austin, TX', 'Chicago, IL',
+    'Boston, MA', 'Los Angeles, CA', 'Denver, CO', 'Atlanta, GA', 'Miami, FL'
+]
+
+HR_SKILLS = [
+    'Talent Acquisition', 'Employee Relations', 'Performance Management', 'HRIS',
+    'Compensation & Benefits', 'Training & Development', 'Employment Law', 'Analytics',
+    'Change Management', 'Diversity & Inclusion', 'Organizational Psychology', 'Leadership'
+]
+
+UNIVERSITIES = ['Stanford', 'Harvard', 'MIT', 'UC Berkeley', 'Northwestern', 'Penn State']
+DEGREES = ['MBA', 'MS in HR Management', 'BA in Psychology', 'MS in Organizational Psychology']
+PROFILE_STRENGTHS = ['Beginner', 'Intermediate', 'Advanced', 'Expert']
+
+ENHANCED_HR_KEYWORDS = ['human resources', 'hr', 'hris', 'talent', 'recruit', 'people', 'employee', 'organizational development', 'workforce']
+
+
+class EnhancedLinkedInScraper(BaseScraper):
+    profile_columns = [
+        'profile_url', 'profile_name', 'company_name', 'job_title', 'department', 'location',
+        'years_experience', 'education', 'skills_count', 'is_hr_related'
+    ]
+    cert_columns = ['certification', 'provider', 'type', 'issued', 'renewal', 'credential_id']
+    hr_certifications = CERTIFICATION_CATALOG
+    default_hr_keywords = ENHANCED_HR_KEYWORDS
+
+    def __init__(self, cache=None, simulate_delay=True, metrics=None, endpoint=None, rate_limiter=None):
+        super().__init__(cache, simulate_delay, metrics, endpoint, rate_limiter)
+        
+        # Sample profile photos (placeholder URLs)
+        self.sample_photos = [
+            "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face",
+            "https://images.unsplash.com/photo-1494790108755-2616b612b587?w=150&h=150&fit=crop&crop=face",
+            "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=150&h=150&fit=crop&crop=face",
+            "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=150&h=150&fit=crop&crop=face",
+            "https://images.unsplash.com/photo-1500648767791-00dcc994a43e?w=150&h=150&fit=crop&crop=face",
+            "https://images.unsplash.com/photo-1534528741775-53994a69daeb?w=150&h=150&fit=crop&crop=face"
+        ]
+
+    def generate_detailed_profile(self, url):
+        """Generate comprehensive profile data with enhanced details
+
+        Everything is drawn from a generator seeded with a stable digest of
+        the URL, so the same URL yields the same profile in any process.
+        """
+        digest = profile_digest(url)
+        rng = random.Random(digest)
+        
+        # Generate profile
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        company = rng.choice(COMPANIES)
+        title = rng.choice(HR_TITLES)
+        location = rng.choice(LOCATIONS)
+        photo = rng.choice(self.sample_photos)
+        
+        # Experience years
+        years_exp = rng.randint(2, 15)
+        
+        # Skills
+        selected_skills = rng.sample(HR_SKILLS, rng.randint(4, 8))
+        
+        return {
+            'profile_id': f"{digest:016x}",
+            'profile_name': name,
+            'company_name': company,
+            'job_title': title,
+            'department': 'Human Resources',
+            'location': location,
+            'profile_photo': photo,
+            'years_experience': years_exp,
+            'skills': selected_skills,
+            'education': f"{rng.choice(DEGREES)} from {rng.choice(UNIVERSITIES)}",
+            'employee_count': f"{rng.randint(50, 500)}+ employees managed",
+            'certifications': self.generate_sample_certs(rng),
+            'summary': f"Experienced {title.lower()} with {years_exp}+ years in HR operations, specializing in talent management and organizational development.",
+            'linkedin_url': url,
+            'last_updated': datetime.now().strftime("%Y-%m-%d"),
+            'profile_strength': rng.choice(PROFILE_STRENGTHS)
+        }
+
+    generate_profile = generate_detailed_profile
+
+    def generate_sample_certs(self, rng=random):
+        certs = list(self.hr_certifications.keys())
+        selected_certs = rng.sample(certs, rng.randint(0, 3))
+        
+        return [{
+            'name': cert,
+            'provider': self.hr_certifications[cert][0],
+            'type': self.hr_certifications[cert][1],
+            'issued_date': f"{rng.randint(1,12):02d}/{rng.randint(2020,2023)}",
+            'renewal_date': f"{rng.randint(1,12):02d}/{rng.randint(2024,2026)}",
+            'credential_id': f"CERT-{rng.randint(100000, 999999)}"
+        } for cert in selected_certs]
+
+    def _rows(self, url, profile_data):
+        # Create base record
+        base = {
+            'profile_url': url,
+            'profile_name': profile_data['profile_name'],
+            'company_name': profile_data['company_name'],
+            'job_title': profile_data['job_title'],
+            'department': profile_data['department'],
+            'location': profile_data['location'],
+            'years_experience': profile_data['years_experience'],
+            'education': profile_data['education'],
+            'skills_count': len(profile_data['skills']),
+            'is_hr_related': self.is_hr_related(profile_data['job_title'], profile_data['department'])
+        }
+        
+        # Handle certifications
+        certs = [{
+            'certification': cert['name'], 
+            'provider': cert['provider'], 
+            'type': cert['type'], 
+            'issued': cert['issued_date'], 
+            'renewal': cert['renewal_date'],
+            'credential_id': cert['credential_id']
+        } for cert in profile_data['certifications']]
+        
+        return base, certs, profile_data
+
+    def iter_extracted(self, urls, update_cb=None, max_workers=1, per_host_limit=None, journal=None, processes=None, progress=None):
+        """Yield (base, certs, profile, first_seen) for every valid input URL, in input order (see _iter_rows)"""
+        for item, first_seen in self._iter_rows(urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+            yield (*item, first_seen)
+
+    def iter_process_urls(self, urls, update_cb=None, max_workers=1, per_host_limit=None, batch_size=50, journal=None, processes=None, progress=None):
+        """Yield (DataFrame, detailed_profiles) batches in input order as profiles complete"""
+        with self.metrics.stage('run'):
+            builder = self.new_result_builder()
+            profiles = []
+            for base, certs, profile_data, first_seen in self.iter_extracted(urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+                self._expand(builder, base, certs)
+                if first_seen:
+                    profiles.append(profile_data)
+                if len(builder) >= batch_size:
+                    yield self._build(builder), profiles
+                    builder, profiles = self.new_result_builder(), []
+
+            if len(builder):
+                yield self._build(builder), profiles
+
+    def process_urls(self, urls, update_cb=None, max_workers=1, per_host_limit=None, normalized=False, journal=None, processes=None, progress=None):
+        """Return (results, detailed_profiles); results is one row per certification,
+        or a (profiles, certifications) pair of frames if normalized"""
+        with self.metrics.stage('run'):
+            builder = self.new_result_builder()
+            detailed_profiles = []
+
+            for base, certs, profile_data, first_seen in self.iter_extracted(urls, update_cb, max_workers, per_host_limit, journal, processes, progress):
+                self._expand(builder, base, certs)
+                if first_seen:
+                    detailed_profiles.append(profile_data)
+
+            results = self._build(builder, normalized)
+        return results, detailed_profiles
@@ -0,0 +1,40 @@
+"""Process-pool sharding for CPU-bound, pure-Python per-item work."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _run_shard(func, items):
+    return [func(item) for item in items]
+
+
+def imap_sharded(func, items, processes=None, shard_size=1000, update_cb=None):
+    """Yield func(item) for every item, computed on a process pool, in input order.
+
+    items are cut into contiguous shards of shard_size. func must be
+    picklable (a module-level function or a bound method of a picklable
+    object); results only match a single-process run if func does not
+    depend on process-global state such as the random module.
+    """
+    items = list(items)
+    total = len(items)
+    shards = [items[i:i + shard_size] for i in range(0, total, shard_size)]
+    if not shards:
+        return
+    done = 0
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(_run_shard, func, shard) for shard in shards]
+        try:
+            for future in futures:
+                results = future.result()
+                done += len(results)
+                if update_cb:
+                    update_cb(done, total)
+                yield from results
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def map_sharded(func, items, processes=None, shard_size=1000, update_cb=None):
+    """List form of imap_sharded."""
+    return list(imap_sharded(func, items, processes, shard_size, update_cb))
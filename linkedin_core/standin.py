@@ -0,0 +1,123 @@
+"""Local stand-in for a profile API, for exercising the HTTP fetch backend.
+
+    python -m linkedin_core.standin --port 8000 --error-rate 0.1
+    python -m linkedin_core urls.txt --endpoint 'http://127.0.0.1:8000/in/{slug}'
+
+GET /in/<slug> returns the simulated profile JSON for that slug (basic
+schema, or the detailed one with --enhanced). error_rate answers that
+fraction of requests with a 503, rate_limit answers requests beyond that
+many per second with a 429 and Retry-After, and latency delays every
+response, so retries, backoff, the circuit breaker and the adaptive rate
+limiter can be watched end to end. Responses carry an ETag (a hash of
+the body) and a matching If-None-Match is answered with 304 Not Modified,
+as incremental refreshes expect.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .cache import content_digest
+from .ratelimit import RateLimiter
+from .scrapers import EnhancedLinkedInScraper, LinkedInScraper
+
+
+class StandInServer:
+    def __init__(self, port=0, host='127.0.0.1', enhanced=False, error_rate=0.0, latency=0.0, rate_limit=None):
+        self.error_rate = error_rate
+        self.latency = latency
+        # Server-side quota: a plain (non-adaptive) token bucket with a one-second burst
+        self.quota = RateLimiter(rate_limit, burst=max(1, int(rate_limit))) if rate_limit else None
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.not_modified = 0
+        scraper = (EnhancedLinkedInScraper if enhanced else LinkedInScraper)(simulate_delay=False)
+        generate = scraper.generate_detailed_profile if enhanced else scraper.extract_profile_data
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, as a real API would
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                if not self.path.startswith('/in/'):
+                    self._send(404, {'error': 'not found'})
+                elif server.quota is not None and not server.quota.try_acquire('quota'):
+                    server.throttled += 1
+                    self._send(429, {'error': 'rate limited'}, {'Retry-After': '1'})
+                elif random.random() < server.error_rate:
+                    server.errors += 1
+                    self._send(503, {'error': 'unavailable'})
+                else:
+                    profile = generate(f"https://www.linkedin.com{self.path}")
+                    etag = f'"{content_digest(profile)}"'
+                    if self.headers.get('If-None-Match') == etag:
+                        server.not_modified += 1
+                        self._send(304, None, {'ETag': etag})
+                    else:
+                        self._send(200, profile, {'ETag': etag})
+
+            def _send(self, status, payload, headers=None):
+                body = json.dumps(payload).encode() if payload is not None else b''
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if payload is not None:
+                    self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def endpoint(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/in/{{slug}}"
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m linkedin_core.standin', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--enhanced', action='store_true', help='serve detailed (Pro) profiles')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds to wait before every response')
+    parser.add_argument('--rate-limit', type=float, help='answer requests beyond this many per second with 429')
+    args = parser.parse_args(argv)
+    server = StandInServer(args.port, enhanced=args.enhanced, error_rate=args.error_rate, latency=args.latency,
+                           rate_limit=args.rate_limit)
+    print(f"Serving profiles at {server.endpoint}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
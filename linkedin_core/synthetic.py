@@ -0,0 +1,105 @@
+"""Vectorized synthetic profile generator for load testing."""
+
+import numpy as np
+import pandas as pd
+
+from .certs import CERTIFICATION_CATALOG
+from .classify import HRClassifier
+from .scrapers import (
+    COMPANIES,
+    DEGREES,
+    ENHANCED_HR_KEYWORDS,
+    FIRST_NAMES,
+    HR_SKILLS,
+    HR_TITLES,
+    LAST_NAMES,
+    LOCATIONS,
+    UNIVERSITIES,
+)
+
+_ISSUED = [f"{m:02d}/{y}" for y in range(2020, 2024) for m in range(1, 13)]
+_RENEWAL = [f"{m:02d}/{y}" for y in range(2024, 2027) for m in range(1, 13)]
+
+
+def _categorical(codes, categories):
+    return pd.Categorical.from_codes(np.asarray(codes, dtype=np.int32), categories=categories)
+
+
+def _skill_sets(rng, n):
+    """Pick 4-8 distinct skills per profile; returns (joined skill strings, counts)."""
+    k = len(HR_SKILLS)
+    counts = rng.integers(4, 9, n)
+    ranks = rng.random((n, k)).argsort(axis=1).argsort(axis=1)
+    chosen = ranks < counts[:, None]
+    masks = chosen @ (1 << np.arange(k))
+    # Every subset of the skill list as one string, looked up by bitmask
+    table = ['; '.join(HR_SKILLS[i] for i in range(k) if m >> i & 1) for m in range(1 << k)]
+    return _categorical(masks, table).remove_unused_categories(), counts
+
+
+def synthetic_profiles(n, seed=None, start=0):
+    """One DataFrame of n synthetic enhanced profiles, one row per certification.
+
+    Columns match EnhancedLinkedInScraper.process_urls output, plus the
+    semicolon-joined 'skills'. Every column is drawn array-wise with numpy
+    and low-cardinality text is stored as categoricals, so a million
+    profiles take seconds. start offsets the synthetic profile URLs.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(start, start + n)
+
+    first = rng.integers(0, len(FIRST_NAMES), n)
+    last = rng.integers(0, len(LAST_NAMES), n)
+    names = [f"{f} {l}" for f in FIRST_NAMES for l in LAST_NAMES]
+    title_codes = rng.integers(0, len(HR_TITLES), n)
+    titles = _categorical(title_codes, HR_TITLES)
+    educations = [f"{d} from {u}" for d in DEGREES for u in UNIVERSITIES]
+    skills, skill_counts = _skill_sets(rng, n)
+
+    classifier = HRClassifier(ENHANCED_HR_KEYWORDS)
+    hr_by_title = np.array([classifier(t, 'Human Resources') for t in HR_TITLES])
+
+    profiles = pd.DataFrame({
+        'profile_url': pd.Series(ids).astype(str).radd('https://www.linkedin.com/in/synthetic-'),
+        'profile_name': _categorical(first * len(LAST_NAMES) + last, names),
+        'company_name': _categorical(rng.integers(0, len(COMPANIES), n), COMPANIES),
+        'job_title': titles,
+        'department': _categorical(np.zeros(n), ['Human Resources']),
+        'location': _categorical(rng.integers(0, len(LOCATIONS), n), LOCATIONS),
+        'years_experience': rng.integers(2, 16, n).astype(np.int8),
+        'education': _categorical(rng.integers(0, len(educations), n), educations),
+        'skills_count': skill_counts.astype(np.int8),
+        'is_hr_related': hr_by_title[title_codes],
+        'skills': skills,
+    })
+
+    # 0-3 distinct certifications per profile; uncertified profiles keep one blank row
+    cert_names = list(CERTIFICATION_CATALOG)
+    cert_counts = rng.integers(0, 4, n)
+    rows_per_profile = np.maximum(cert_counts, 1)
+    row_profile = np.repeat(np.arange(n), rows_per_profile)
+    row_slot = np.arange(len(row_profile)) - np.repeat(np.cumsum(rows_per_profile) - rows_per_profile, rows_per_profile)
+    has_cert = row_slot < cert_counts[row_profile]
+    picks = rng.random((n, len(cert_names))).argsort(axis=1)[:, :3]
+    cert_codes = np.where(has_cert, picks[row_profile, np.minimum(row_slot, 2)] + 1, 0)
+
+    m = len(row_profile)
+    providers = [''] + [CERTIFICATION_CATALOG[c][0] for c in cert_names]
+    types = [''] + [CERTIFICATION_CATALOG[c][1] for c in cert_names]
+    credential = pd.Series(rng.integers(100000, 1000000, m)).astype(str).radd('CERT-')
+
+    frame = profiles.take(row_profile).reset_index(drop=True)
+    frame['certification'] = _categorical(cert_codes, [''] + cert_names)
+    frame['provider'] = pd.Categorical(np.array(providers, dtype=object)[cert_codes])
+    frame['type'] = pd.Categorical(np.array(types, dtype=object)[cert_codes])
+    frame['issued'] = _categorical(np.where(has_cert, rng.integers(0, len(_ISSUED), m) + 1, 0), [''] + _ISSUED)
+    frame['renewal'] = _categorical(np.where(has_cert, rng.integers(0, len(_RENEWAL), m) + 1, 0), [''] + _RENEWAL)
+    frame['credential_id'] = credential.where(has_cert, '')
+    return frame
+
+
+def iter_synthetic_profiles(n, chunk_size=100_000, seed=None):
+    """Yield synthetic_profiles frames covering n profiles, chunk_size at a time."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunk_size):
+        yield synthetic_profiles(min(chunk_size, n - start), seed=rng.integers(2**63), start=start)
@@ -0,0 +1,181 @@
+"""Canonical LinkedIn profile URLs and input de-duplication."""
+
+import hashlib
+import re
+from urllib.parse import unquote, urlparse
+
+import numpy as np
+import pandas as pd
+
+_SLUG_RE = re.compile(r'^/in/([^/\s]+)(?:/|$)', re.IGNORECASE)
+_HAS_SCHEME_RE = re.compile(r'^[a-z][a-z0-9+.\-]*://', re.IGNORECASE)
+
+_SCHEME = r'(?:[a-z][a-z0-9+.\-]*://)?(?:[^@/?#\s]*@)?'
+_HOST = r'(?:[^/?#:\s]*\.)?linkedin\.com(?::\d*)?'
+# Profile URLs canonicalize_url reads the same way as cutting the slug out
+# of the text; everything else (userinfo, escapes, ;params, whitespace,
+# other schemes) is left to canonicalize_url itself
+_PLAIN_PROFILE_RE = r'(?i)(?:https?://)?(?:[a-z0-9\-]+\.)*linkedin\.com(?::\d+)?/in/[^/?#;%\s]+(?:[/?#]\S*)?$'
+_BEFORE_SLUG_RE = r'^(?:https?://)?[^/]*/in/'
+_AFTER_SLUG_RE = r'[/?#].*'
+_LINKEDIN_HOST_RE = rf'(?i){_SCHEME}{_HOST}(?:[/?#\s]|$)'
+_ANY_URL_RE = rf'(?i){_SCHEME}[^/?#\s]+\.[^/?#\s]'
+
+
+def canonicalize_url(url):
+    """Return https://www.linkedin.com/in/<slug> for a profile URL, else None.
+
+    Scheme, locale subdomain (uk., de., m. ...), case, trailing slash,
+    sub-pages, query string and fragment are all normalized away, so every
+    spelling of the same profile maps to one key. URLs with whitespace
+    inside are rejected rather than guessed at.
+    """
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    if not url or any(c.isspace() for c in url):
+        return None
+    if not _HAS_SCHEME_RE.match(url):
+        url = f"https://{url}"
+    try:
+        parsed = urlparse(url)
+    except ValueError:  # e.g. an unbalanced [ in the host
+        return None
+    host = parsed.netloc.lower().rsplit('@', 1)[-1].split(':')[0]
+    if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+        return None
+    match = _SLUG_RE.match(unquote(parsed.path))
+    if not match:
+        return None
+    return f"https://www.linkedin.com/in/{match.group(1).lower()}"
+
+
+def _canonical_column(text):
+    """canonicalize_url over a stripped string Series, as an object array.
+
+    Plain profile URLs have their slug cut out of the whole column with
+    pandas string ops; only the (rare) other rows are parsed one by one.
+    """
+    plain = text.str.match(_PLAIN_PROFILE_RE).fillna(False).astype(bool).to_numpy()
+    # Capture groups are several times slower than a plain match, so the
+    # slug is cut out of the matching rows with two anchored replaces
+    slugs = (text[plain].str.lower()
+             .str.replace(_BEFORE_SLUG_RE, '', regex=True)
+             .str.replace(_AFTER_SLUG_RE, '', regex=True))
+    canonical = np.full(len(text), None, dtype=object)
+    canonical[plain] = ('https://www.linkedin.com/in/' + slugs).to_numpy(dtype=object)
+    rest = text[~plain].to_numpy(dtype=object, na_value=None)
+    canonical[~plain] = [canonicalize_url(url) for url in rest]
+    return canonical
+
+
+def profile_endpoint(template, url):
+    """Fill a profile API URL template such as http://host/in/{slug} for a profile URL."""
+    return template.format(slug=canonicalize_url(url).rsplit('/', 1)[-1])
+
+
+def profile_digest(url):
+    """Stable 64-bit integer digest of a profile URL.
+
+    Unlike hash(), it is the same in every process and on every run, and
+    all spellings of one profile share it.
+    """
+    key = canonicalize_url(url) or str(url)
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+
+def url_set_key(urls):
+    """Digest of the input URLs in order, duplicates included, for keying cached results.
+
+    Results fan out to every input row in input order, so a reordered or
+    repeated list needs its own key.
+    """
+    digest = hashlib.sha1()
+    for url in urls:
+        digest.update(str(url).encode())
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class UrlIndex:
+    """De-duplicating index over a list of input URLs.
+
+    unique holds each canonical profile URL once, in first-seen order,
+    urls the input rows as given, and positions is an int array mapping
+    every input row to its slot in unique (-1 if the row is not a valid
+    profile URL). urls may be any iterable,
+    such as itertools.chain.from_iterable(iter_url_chunks(...)). Rows are
+    canonicalized exactly as canonicalize_url would, but column-wise, and
+    factorized.
+    """
+
+    def __init__(self, urls):
+        raw = np.array(list(urls), dtype=object)
+        text = pd.Series(raw, dtype=object).astype('string').str.strip()
+        codes, uniques = pd.factorize(_canonical_column(text))
+        self.urls = raw
+        self.unique = uniques.tolist()
+        self.positions = codes
+        # Last input row referencing each slot, so streamed values can be
+        # released as soon as no later row needs them
+        rows = np.flatnonzero(codes >= 0)[::-1]
+        _, first = np.unique(codes[rows], return_index=True)
+        self._last = rows[first].tolist()
+
+    @property
+    def invalid(self):
+        return int((self.positions < 0).sum())
+
+    def iter_slots(self, values):
+        """Yield (url, slot, value) for every valid input row, in input order.
+
+        url is the row as it was given, not its canonical form.
+
+        values is consumed lazily in slot order (a list or a generator such
+        as imap_ordered over self.unique); each row is emitted as soon as
+        the value for its slot is available.
+        """
+        held = {}
+        ready = 0
+        urls = self.urls
+        positions = self.positions.tolist()
+        pos = 0
+        for slot_value in values:
+            held[ready] = slot_value
+            ready += 1
+            # Invalid rows (-1) are always behind ready
+            while pos < len(positions) and positions[pos] < ready:
+                slot = positions[pos]
+                if slot >= 0:
+                    yield urls[pos], slot, held[slot]
+                    if self._last[slot] == pos:
+                        del held[slot]
+                pos += 1
+
+
+def validate_urls(urls):
+    """Validate a whole column of URLs at once with pandas string ops.
+
+    Returns a DataFrame aligned with the input holding the original 'url',
+    a boolean 'valid' mask and a 'reason' ('' for valid rows, otherwise one
+    of 'empty', 'not a URL', 'wrong host', 'bad profile id', 'missing /in/').
+    A row is valid exactly when canonicalize_url accepts it. Only rejected
+    rows go through the extra reason-classification passes.
+    """
+    urls = pd.Series(urls, copy=False)
+    text = urls.astype('string').str.strip()
+    valid = pd.Series(pd.notna(_canonical_column(text)), index=urls.index)
+
+    reason = pd.Series('', index=urls.index, dtype=object)
+    rejected = text[~valid]
+    if len(rejected):
+        empty = (rejected.isna() | (rejected == '')).fillna(True).astype(bool).to_numpy()
+        is_url = rejected.str.match(_ANY_URL_RE).fillna(False).astype(bool).to_numpy()
+        on_host = rejected.str.match(_LINKEDIN_HOST_RE).fillna(False).astype(bool).to_numpy()
+        has_in = rejected.str.contains('/in/', case=False, regex=False).fillna(False).astype(bool).to_numpy()
+        reason[~valid] = np.select(
+            [empty, ~is_url, ~on_host, has_in],
+            ['empty', 'not a URL', 'wrong host', 'bad profile id'],
+            default='missing /in/',
+        )
+    return pd.DataFrame({'url': urls, 'valid': valid, 'reason': reason}, index=urls.index)
@@ -1,166 +1,208 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
-import requests
-from urllib.parse import urlparse
-import random
 import time
-from datetime import datetime
-import io
-import base64
+import os
+import uuid
+from collections import deque
+
+from linkedin_core import (
+    JobJournal,
+    LinkedInScraper,
+    Metrics,
+    ProfileCache,
+    ProgressStream,
+    background_css,
+    head_injection,
+    job_id,
+    load_urls,
+    read_header,
+    spool_export,
+    start_metrics_server,
+    url_set_key,
+    validate_urls,
+)
 
 # Configure Streamlit page (set first)
 st.set_page_config(page_title="LinkedIn HR Profile Extractor", page_icon="📄", layout="wide")
 
 # ------------------------------ Set Background ------------------------------ #
+PAGE_ANIMATIONS = """
+.stApp {
+    animation: fadeIn 1.5s ease-in-out;
+}
+@keyframes fadeIn {
+    from { opacity: 0; }
+    to { opacity: 1; }
+}
+.block-container {
+    animation: slideUp 1s ease-out;
+}
+@keyframes slideUp {
+    from { transform: translateY(20px); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+"""
+
 def set_background(image_file):
-    with open(image_file, "rb") as file:
-        encoded_string = base64.b64encode(file.read()).decode()
-    css = f"""
-    <style>
-    .stApp {{
-        background-image: url("data:image/png;base64,{encoded_string}");
-        background-size: cover;
-        background-repeat: no-repeat;
-        background-attachment: fixed;
-        animation: fadeIn 1.5s ease-in-out;
-    }}
-    @keyframes fadeIn {{
-        from {{ opacity: 0; }}
-        to {{ opacity: 1; }}
-    }}
-    .block-container {{
-        animation: slideUp 1s ease-out;
-    }}
-    @keyframes slideUp {{
-        from {{ transform: translateY(20px); opacity: 0; }}
-        to {{ transform: translateY(0); opacity: 1; }}
-    }}
-    </style>
-    """
-    st.markdown(css, unsafe_allow_html=True)
+    # The encoded image is cached per process and only sent once per browser session
+    if st.session_state.get('_background_injected'):
+        return
+    components.html(head_injection('hr-background', 'style', background_css(image_file) + PAGE_ANIMATIONS), height=0)
+    st.session_state['_background_injected'] = True
 
 set_background("background.png")
 
-# ------------------------------ Helper Class ------------------------------ #
-class LinkedInScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        self.hr_certifications = {
-            'SHRM-CP': ('SHRM', 'HR Management'),
-            'PHR': ('HRCI', 'HR Professional'),
-            'SPHR': ('HRCI', 'Senior HR Professional'),
-            'CHRP': ('HRPA', 'Chartered HR Professional')
-        }
-        self.hr_keywords = ['human resources', 'hr', 'talent', 'recruit', 'people', 'employee']
-
-    def is_valid_linkedin_url(self, url):
-        parsed = urlparse(url)
-        return 'linkedin.com' in parsed.netloc and '/in/' in parsed.path
-
-    def extract_profile_data(self, url):
-        time.sleep(0.5)
-        return {
-            'profile_name': f"User {hash(url) % 1000}",
-            'company_name': f"Company {hash(url) % 100}",
-            'job_title': random.choice(['HR Manager', 'Recruiter', 'People Ops Lead']),
-            'department': 'HR',
-            'location': 'USA',
-            'certifications': self.generate_sample_certs()
-        }
-
-    def generate_sample_certs(self):
-        certs = list(self.hr_certifications.keys())
-        return [{
-            'name': c,
-            'provider': self.hr_certifications[c][0],
-            'type': self.hr_certifications[c][1],
-            'issued_date': f"{random.randint(1,12):02d}/{random.randint(2020,2023)}",
-            'renewal_date': f"{random.randint(1,12):02d}/{random.randint(2024,2026)}"
-        } for c in random.sample(certs, random.randint(0, len(certs)))]
-
-    def is_hr_related(self, title, dept):
-        return any(k in f"{title} {dept}".lower() for k in self.hr_keywords)
-
-    def process_urls(self, urls, update_cb=None):
-        results = []
-        for i, url in enumerate(urls):
-            if update_cb:
-                update_cb(i + 1, len(urls))
-            if not self.is_valid_linkedin_url(url):
-                continue
-            data = self.extract_profile_data(url)
-            base = {
-                'profile_url': url,
-                'profile_name': data['profile_name'],
-                'company_name': data['company_name'],
-                'job_title': data['job_title'],
-                'department': data['department'],
-                'location': data['location'],
-                'is_hr_related': self.is_hr_related(data['job_title'], data['department'])
-            }
-            if not data['certifications']:
-                results.append({**base, 'certification': '', 'provider': '', 'type': '', 'issued': '', 'renewal': ''})
-            else:
-                for cert in data['certifications']:
-                    results.append({**base, 'certification': cert['name'], 'provider': cert['provider'], 'type': cert['type'], 'issued': cert['issued_date'], 'renewal': cert['renewal_date']})
-        return results
-
 # ------------------------------ UI Layout ------------------------------ #
+@st.cache_resource
+def get_profile_cache():
+    return ProfileCache(".profile_cache.sqlite3")
+
+@st.cache_resource
+def get_metrics():
+    # Process-wide totals; set LINKEDIN_METRICS_PORT to scrape them at /metrics
+    metrics = Metrics()
+    port = os.environ.get('LINKEDIN_METRICS_PORT')
+    if port:
+        start_metrics_server(metrics, int(port))
+    return metrics
+
 st.title("📄 LinkedIn HR Profile Extractor")
 st.markdown("""
 Upload LinkedIn profile URLs to extract simulated HR-related data such as job titles and certifications.
 This is a demo and does not scrape real LinkedIn content.
 """)
 
-scraper = LinkedInScraper()
+scraper = LinkedInScraper(cache=get_profile_cache(), metrics=Metrics())
 st.sidebar.title("Settings")
 filter_hr = st.sidebar.checkbox("Only show HR-related profiles", False)
 filter_cert = st.sidebar.checkbox("Only show certified profiles", False)
+if st.sidebar.button("Clear profile cache"):
+    scraper.cache.clear()
+max_workers = st.sidebar.slider("Parallel workers", 1, 32, 8)
 
 with st.expander("📤 Upload LinkedIn URLs"):
     uploaded_file = st.file_uploader("Upload CSV/Excel with LinkedIn URLs", type=['csv', 'xlsx'])
     manual_input = st.text_area("Or paste LinkedIn URLs (one per line):")
 
-urls = []
-df = None
+def upload_columns(uploaded_file):
+    # The header is read once per upload, not on every rerun
+    header = st.session_state.get('_upload_header')
+    if header is None or header[0] != uploaded_file.file_id:
+        header = st.session_state['_upload_header'] = (uploaded_file.file_id, read_header(uploaded_file, uploaded_file.name))
+    return header[1]
+
+def prepare_urls(source, load):
+    # Loading, validation and the URL-set key run once per upload and column (or
+    # pasted text); reruns such as a filter toggle reuse them from session state
+    prepared = st.session_state.get('_prepared_urls')
+    if prepared is None or prepared['source'] != source:
+        loaded = load()
+        checked = validate_urls(loaded)
+        valid = checked['valid']
+        urls = checked.loc[valid, 'url'].tolist()
+        prepared = st.session_state['_prepared_urls'] = {
+            'source': source,
+            'loaded': len(loaded),
+            'urls': urls,
+            'rejected': checked.loc[~valid, ['url', 'reason']],
+            'key': url_set_key(urls),
+        }
+    return prepared
+
+prepared = None
 if uploaded_file:
     try:
-        if uploaded_file.name.endswith("csv"):
-            df = pd.read_csv(uploaded_file)
-        else:
-            df = pd.read_excel(uploaded_file)
-        url_col = st.selectbox("Select the column with LinkedIn URLs", df.columns)
-        urls = df[url_col].dropna().tolist()
-        st.success(f"Loaded {len(urls)} URLs from file.")
+        # Only the header is read to offer columns; the chosen column is then streamed in chunks
+        columns = upload_columns(uploaded_file)
+        url_col = st.selectbox("Select the column with LinkedIn URLs", columns)
+        prepared = prepare_urls((uploaded_file.file_id, url_col),
+                                lambda: load_urls(uploaded_file, uploaded_file.name, url_col))
+        st.success(f"Loaded {prepared['loaded']} URLs from file.")
     except Exception as e:
         st.error(f"Failed to process file: {e}")
 elif manual_input:
-    urls = [line.strip() for line in manual_input.strip().split('\n') if line.strip()]
-    st.success(f"Loaded {len(urls)} URLs from manual input.")
+    prepared = prepare_urls(('manual', hash(manual_input)),
+                            lambda: [line.strip() for line in manual_input.strip().split('\n') if line.strip()])
+    st.success(f"Loaded {prepared['loaded']} URLs from manual input.")
 
-if st.button("🚀 Extract Profiles") and urls:
-    st.info("Processing profiles... Please wait.")
-    bar = st.progress(0)
-    status = st.empty()
-
-    def update_progress(current, total):
-        bar.progress(current / total)
-        status.text(f"Processing {current} of {total}")
+urls = prepared['urls'] if prepared is not None else []
 
-    data = scraper.process_urls(urls, update_progress)
-    df_result = pd.DataFrame(data)
+# Rejected entries can be downloaded; the report is only built on click
+if prepared is not None and len(prepared['rejected']):
+    rejected = prepared['rejected']
+    st.warning(f"{len(rejected)} of {prepared['loaded']} entries are not LinkedIn profile URLs and will be skipped.")
+    st.download_button("📥 Download rejection report", lambda: rejected.to_csv(index=False),
+                       "rejected_urls.csv", "text/csv")
 
+def apply_filters(df):
+    mask = pd.Series(True, index=df.index)
     if filter_hr:
-        df_result = df_result[df_result['is_hr_related']]
+        mask &= df['is_hr_related']
     if filter_cert:
-        df_result = df_result[df_result['certification'] != '']
+        mask &= df['certification'] != ''
+    return df[mask]
+
+# Extraction results live in session state keyed by the URL set, so toggling
+# a filter only re-applies a mask instead of re-extracting everything
+results_key = prepared['key'] if prepared is not None else None
+
+if st.button("🚀 Extract Profiles") and urls:
+    st.info("Processing profiles... Please wait.")
+    bar = st.progress(0)
+    status = st.empty()
 
+    # Widgets are updated from coalesced events (a few per second), not once per URL
+    progress = ProgressStream(interval=0.25)
+
+    @progress.subscribe
+    def show_progress(event):
+        bar.progress(event.processed / event.total if event.total else 1.0)
+        status.text(event.describe())
+
+    table = st.empty()
+    frames = []
+    # Only the newest filtered batches are shown while rows stream in, redrawn at
+    # most once a second, so each redraw stays small; the full table is built once at the end
+    recent = deque(maxlen=20)
+    last_render = 0.0
+    # Completed profiles are journaled under the URL-set key, so a dropped
+    # session resumes where it stopped when the same URLs are extracted again.
+    # The job id lives in the page URL: a reload keeps it, other tabs get their own
+    if 'job' not in st.query_params:
+        st.query_params['job'] = uuid.uuid4().hex[:12]
+    journal = JobJournal(job_id(scraper, results_key, st.query_params['job']))
+    for df_batch in scraper.iter_process_urls(urls, max_workers=max_workers, journal=journal, progress=progress):
+        frames.append(df_batch)
+        recent.append(apply_filters(df_batch))
+        if time.time() - last_render > 1:
+            table.dataframe(pd.concat(recent, ignore_index=True), use_container_width=True)
+            last_render = time.time()
+    table.empty()
+    st.session_state['results'] = {
+        'key': results_key,
+        'df': pd.concat(frames, ignore_index=True) if frames else scraper.new_result_builder().to_frame(),
+        'metrics': scraper.metrics.summary(),
+    }
+    get_metrics().merge(scraper.metrics)
+    journal.remove()
+
+cached = st.session_state.get('results')
+if urls and cached and cached['key'] == results_key:
+    with get_metrics().stage('filter'):
+        df_result = apply_filters(cached['df'])
+
+    fetch_errors = cached['metrics']['counters'].get('fetch_errors', 0)
+    if fetch_errors:
+        st.warning(f"{fetch_errors} profiles could not be fetched and are missing from the results.")
+    stats = scraper.cache.stats()
+    st.caption(f"Cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_ratio']:.0%} hit ratio)")
+    with st.expander("Run metrics"):
+        st.json(cached['metrics'])
     with st.expander("🔍 View Results"):
         st.success(f"Processed {len(df_result)} entries.")
         st.dataframe(df_result, use_container_width=True)
 
-    csv = df_result.to_csv(index=False)
-    st.download_button("📥 Download CSV", csv, "linkedin_results.csv", "text/csv")
+    # Written chunk by chunk to a temporary file only when the button is clicked
+    st.download_button("📥 Download CSV", lambda: spool_export(df_result, 'csv', metrics=get_metrics()),
+                       "linkedin_results.csv", "text/csv")
@@ -0,0 +1,74 @@
+"""asyncio extraction: results, and cancellation of lookups in flight."""
+
+import asyncio
+import time
+
+from linkedin_core import LinkedInScraper, Metrics, RateLimiter
+
+URLS = [f'https://www.linkedin.com/in/person-{i}' for i in range(20)]
+
+
+def _slow_scraper():
+    # Two profiles go through at once, the rest wait ~1s each for a token
+    scraper = LinkedInScraper(metrics=Metrics(), rate_limiter=RateLimiter(rate=1, burst=2, max_rate=1))
+    generated = []
+    generate = scraper.generate_profile
+    scraper.generate_profile = lambda url: generated.append(url) or generate(url)
+    return scraper, generated
+
+
+async def _collect(scraper, urls):
+    return {url: item async for url, item in scraper.aprocess_urls(urls, concurrency=4)}
+
+
+def test_async_extraction_matches_threads():
+    scraper = LinkedInScraper(simulate_delay=False)
+    results = asyncio.run(_collect(scraper, URLS + URLS[:3] + ['not a url']))
+    # One item per distinct profile; invalid rows are not looked up at all
+    assert sorted(results) == sorted(URLS)
+    assert results[URLS[0]] == scraper.process_url(URLS[0])
+
+
+def test_cancelling_the_consumer_cancels_lookups_in_flight():
+    scraper, generated = _slow_scraper()
+
+    async def run():
+        received = []
+
+        async def consume():
+            async for item in scraper.aprocess_urls(URLS, concurrency=4):
+                received.append(item)
+
+        task = asyncio.ensure_future(consume())
+        while len(received) < 2:
+            await asyncio.sleep(0.01)
+        start = time.monotonic()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        elapsed = time.monotonic() - start
+        # The rate-limit waits of the cancelled lookups are abandoned too
+        await asyncio.sleep(1.5)
+        others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return received, elapsed, others
+
+    received, elapsed, others = asyncio.run(run())
+    assert len(received) == 2 and not others
+    assert elapsed < 0.5
+    assert len(generated) == 2
+
+
+def test_closing_the_iterator_early_cancels_lookups_in_flight():
+    scraper, generated = _slow_scraper()
+
+    async def run():
+        results = scraper.aprocess_urls(URLS, concurrency=4)
+        first = await results.__anext__()
+        await results.aclose()
+        await asyncio.sleep(1.5)
+        return first
+
+    assert asyncio.run(run())[1] is not None
+    assert len(generated) <= 2
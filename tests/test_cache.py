@@ -0,0 +1,145 @@
+"""SQLite profile cache: TTL expiry, LRU eviction and incremental refresh."""
+
+import pytest
+
+from linkedin_core import FetchError, LinkedInScraper, Metrics, ProfileCache
+from linkedin_core import cache as cache_module
+
+URLS = [f'https://www.linkedin.com/in/person-{i}' for i in range(4)]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, 'time', clock.time)
+    return clock
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = ProfileCache(tmp_path / 'c.sqlite3', ttl=60)
+    cache.put(URLS[0], {'n': 0})
+    clock.now += 59
+    assert cache.get(URLS[0]) == {'n': 0}
+    clock.now += 2
+    assert cache.get(URLS[0]) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Expired rows are dropped on the next eviction pass
+    cache._evict()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_spellings_share_one_entry(tmp_path, clock):
+    cache = ProfileCache(tmp_path / 'c.sqlite3')
+    cache.put('uk.linkedin.com/in/Person-0/', {'n': 0})
+    assert cache.get(URLS[0]) == {'n': 0}
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = ProfileCache(tmp_path / 'c.sqlite3', max_entries=3)
+    cache.evict_every = 1
+    for i, url in enumerate(URLS[:3]):
+        cache.put(url, {'n': i})
+        clock.now += 1
+    # Reading person-0 makes person-1 the least recently used
+    assert cache.get(URLS[0]) == {'n': 0}
+    clock.now += 1
+    cache.put(URLS[3], {'n': 3})
+    assert len(cache) == 3
+    assert cache.get(URLS[1]) is None
+    assert [cache.get(url) for url in (URLS[0], URLS[2], URLS[3])] == [{'n': 0}, {'n': 2}, {'n': 3}]
+    cache.close()
+
+
+def test_reopening_keeps_entries_and_applies_limits(tmp_path, clock):
+    path = tmp_path / 'c.sqlite3'
+    cache = ProfileCache(path)
+    for i, url in enumerate(URLS):
+        cache.put(url, {'n': i})
+        clock.now += 1
+    cache.close()
+    cache = ProfileCache(path, max_entries=2)
+    assert len(cache) == 2
+    assert cache.get(URLS[3]) == {'n': 3}
+    cache.close()
+
+
+class _Upstream:
+    """fetch(url, etag) stand-in: serves self.data with self.etag, answering
+    304 (None) when the caller already holds that ETag, or raises FetchError."""
+
+    def __init__(self, data, etag=None):
+        self.data, self.etag, self.down, self.calls = data, etag, False, 0
+
+    def __call__(self, url, etag):
+        self.calls += 1
+        if self.down:
+            raise FetchError(f"GET {url}: down")
+        if etag is not None and etag == self.etag:
+            return None, etag
+        return dict(self.data), self.etag
+
+
+def test_refresh_outcomes(tmp_path, clock):
+    cache = ProfileCache(tmp_path / 'c.sqlite3', refresh_age=60)
+    upstream = _Upstream({'n': 1, 'last_updated': 'monday'})
+    assert cache.refresh(URLS[0], upstream) == ({'n': 1, 'last_updated': 'monday'}, 'new')
+
+    clock.now += 30
+    assert cache.refresh(URLS[0], upstream)[1] == 'fresh'
+    assert upstream.calls == 1
+
+    # Same content under a new last_updated is carried forward unchanged
+    clock.now += 61
+    upstream.data = {'n': 1, 'last_updated': 'tuesday'}
+    assert cache.refresh(URLS[0], upstream) == ({'n': 1, 'last_updated': 'monday'}, 'unchanged')
+    assert cache.entry(URLS[0]).age == 0
+
+    clock.now += 61
+    upstream.data = {'n': 2, 'last_updated': 'wednesday'}
+    assert cache.refresh(URLS[0], upstream) == ({'n': 2, 'last_updated': 'wednesday'}, 'changed')
+
+    clock.now += 61
+    upstream.down = True
+    assert cache.refresh(URLS[0], upstream) == ({'n': 2, 'last_updated': 'wednesday'}, 'stale')
+    # A stale profile stays due for the next refresh
+    assert cache.entry(URLS[0]).age > 60
+    with pytest.raises(FetchError):
+        cache.refresh(URLS[1], upstream)
+
+    # Served from the cache: fresh, unchanged, stale; fetched: new, changed
+    assert (cache.hits, cache.misses) == (3, 2)
+    cache.close()
+
+
+def test_refresh_revalidates_with_etag(tmp_path, clock):
+    cache = ProfileCache(tmp_path / 'c.sqlite3', refresh_age=60)
+    upstream = _Upstream({'n': 1}, etag='"v1"')
+    cache.refresh(URLS[0], upstream)
+    clock.now += 61
+    assert cache.refresh(URLS[0], upstream) == ({'n': 1}, 'unchanged')
+    upstream.data, upstream.etag = {'n': 2}, '"v2"'
+    clock.now += 61
+    assert cache.refresh(URLS[0], upstream) == ({'n': 2}, 'changed')
+    assert cache.entry(URLS[0]).etag == '"v2"'
+    cache.close()
+
+
+def test_scraper_metrics_agree_with_cache_stats(tmp_path):
+    cache = ProfileCache(tmp_path / 'c.sqlite3', refresh_age=0)
+    scraper = LinkedInScraper(cache=cache, metrics=Metrics(), simulate_delay=False)
+    scraper.process_urls(URLS, max_workers=2)
+    scraper.process_urls(URLS + ['https://www.linkedin.com/in/someone-new'], max_workers=2)
+    counters = scraper.metrics.counters
+    assert counters['refresh_new'] == 5 and counters['refresh_unchanged'] + counters.get('refresh_changed', 0) == 4
+    assert (counters['cache_hits'], counters['cache_misses']) == (cache.hits, cache.misses)
+    cache.close()
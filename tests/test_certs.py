@@ -0,0 +1,58 @@
+"""Certification renewal index, checked against a full scan."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from linkedin_core import CertIndex, month_ordinal, synthetic_profiles
+
+
+@pytest.fixture(scope='module')
+def certs():
+    frame = synthetic_profiles(3000, seed=0)
+    return frame, CertIndex(frame)
+
+
+def _brute_force(frame, start, end, **filters):
+    months = np.array([_month(v) for v in frame['renewal']])
+    mask = (frame['certification'] != '').to_numpy() & (months >= start) & (months <= end)
+    for key, value in filters.items():
+        mask &= (frame[key] == value).to_numpy()
+    return set(np.flatnonzero(mask))
+
+
+def _month(value):
+    try:
+        month, year = map(int, value.split('/'))
+    except ValueError:
+        return -1
+    return year * 12 + month - 1
+
+
+@pytest.mark.parametrize('filters', [{}, {'certification': 'PHR'}, {'provider': 'HRCI', 'type': 'Senior HR Professional'}])
+def test_cert_index_matches_a_scan(certs, filters):
+    frame, index = certs
+    start, end = month_ordinal(date(2025, 1, 1)), month_ordinal(date(2026, 6, 1))
+    positions = index.lookup(start, end, **filters)
+    assert set(positions) == _brute_force(frame, start, end, **filters)
+    assert len(positions) == len(set(positions))
+    # Soonest renewal first
+    renewals = [_month(v) for v in frame['renewal'].to_numpy()[positions]]
+    assert renewals == sorted(renewals)
+
+
+def test_cert_index_unknown_values(certs):
+    _, index = certs
+    assert len(index.lookup(certification='NOPE')) == 0
+    with pytest.raises(ValueError):
+        index.lookup(issuer='SHRM')
+
+
+def test_cert_index_renewals_due(certs):
+    frame, index = certs
+    today = date(2025, 3, 15)
+    due = index.renewals_due(90, today=today, certification='SHRM-CP')
+    start, end = index.due_window(90, today)
+    assert set(due.index) == set(frame.index[list(_brute_force(frame, start, end, certification='SHRM-CP'))])
+    assert index.renewals_by_month(start, end).sum() == len(index.lookup(start, end))
@@ -0,0 +1,51 @@
+"""HR-relevance classification of job titles and departments."""
+
+import pandas as pd
+import pytest
+
+from linkedin_core import EnhancedLinkedInScraper, HRClassifier, LinkedInScraper
+
+BASIC = LinkedInScraper(simulate_delay=False).hr_classifier
+ENHANCED = EnhancedLinkedInScraper(simulate_delay=False).hr_classifier
+
+
+@pytest.mark.parametrize('title, dept, expected', [
+    ('HR Manager', 'Operations', True),
+    ('Senior Recruiter', 'Sales', True),
+    ('Engineer', 'Recruitment', True),
+    ('People Partner', 'Finance', True),
+    ('Employee Relations Lead', 'Legal', True),
+    ('Head of Human Resources', 'Executive', True),
+    # Keywords inside other words are not HR
+    ('Team Lead, Group Three', 'Engineering', False),
+    ('Christopher Account Manager', 'Sales', False),
+    ('PeopleSoft Developer', 'IT', False),
+    ('Hrithik Designer', 'Marketing', False),
+])
+def test_keywords_match_whole_words(title, dept, expected):
+    assert BASIC(title, dept) is expected
+
+
+def test_enhanced_keywords_cover_hris():
+    assert ENHANCED('Analyst', 'HRIS')
+    assert not BASIC('Analyst', 'HRIS')
+
+
+def test_classify_frame_matches_row_by_row():
+    df = pd.DataFrame({
+        'job_title': ['Recruiter', 'Engineer', 'Recruiter', None, 'PeopleSoft Admin'],
+        'department': ['Sales', 'HR', 'Sales', 'People', 'IT'],
+    }, index=[10, 11, 12, 13, 14])
+    labels = BASIC.classify_frame(df)
+    assert labels.name == 'is_hr_related'
+    assert labels.index.tolist() == df.index.tolist()
+    assert labels.tolist() == [BASIC(t, d) for t, d in zip(df['job_title'], df['department'])]
+    assert labels.tolist() == [True, True, True, True, False]
+
+
+def test_classifier_is_case_insensitive_and_memoized():
+    classifier = HRClassifier(['human resources', 'talent'])
+    assert classifier('TALENTS lead', '') and classifier('VP, Human Resources', '')
+    assert not classifier('Human Resourcefulness Coach', '')
+    assert classifier._memo == {('TALENTS lead', ''): True, ('VP, Human Resources', ''): True,
+                                ('Human Resourcefulness Coach', ''): False}
@@ -0,0 +1,44 @@
+"""Ordered, per-host-capped thread-pool map."""
+
+import random
+import threading
+import time
+
+import pytest
+
+from linkedin_core import imap_ordered
+
+
+@pytest.mark.parametrize('max_workers', [1, 8])
+def test_imap_ordered_keeps_input_order(max_workers):
+    rng = random.Random(0)
+    delays = [rng.uniform(0, 0.01) for _ in range(50)]
+    progress = []
+
+    def work(i):
+        time.sleep(delays[i])
+        return i * i
+
+    results = list(imap_ordered(work, range(50), max_workers, per_host_limit=2, key=lambda i: i % 3,
+                                update_cb=lambda current, total: progress.append((current, total))))
+    assert results == [i * i for i in range(50)]
+    assert progress == [(i, 50) for i in range(1, 51)]
+
+
+def test_imap_ordered_caps_each_host():
+    lock = threading.Lock()
+    running = {0: 0, 1: 0}
+    peak = {0: 0, 1: 0}
+
+    def work(i):
+        host = i % 2
+        with lock:
+            running[host] += 1
+            peak[host] = max(peak[host], running[host])
+        time.sleep(0.005)
+        with lock:
+            running[host] -= 1
+        return i
+
+    assert list(imap_ordered(work, range(40), 8, per_host_limit=2, key=lambda i: i % 2)) == list(range(40))
+    assert peak == {0: 2, 1: 2}
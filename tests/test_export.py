@@ -0,0 +1,88 @@
+"""Incremental exports: every format reads back as the frames written."""
+
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+from linkedin_core import available_formats, export_filename, spool_export, write_export
+from linkedin_core import export as export_module
+
+FRAME = pd.DataFrame({
+    'profile_url': [f'https://www.linkedin.com/in/p-{i}' for i in range(7)],
+    'profile_name': ['Zoë', 'Anne, "Nan"', 'Jo', 'Li', 'Sam', 'Ola', 'Kim'],
+    'years': [1, 2, 3, 4, 5, 6, 7],
+    'score': [0.5, 1.25, 2.0, 3.5, 4.0, 5.75, 6.0],
+    'is_hr_related': [True, False, True, True, False, False, True],
+})
+
+
+def _chunks():
+    # An empty first chunk, then uneven ones, as streamed batches arrive
+    return [FRAME.iloc[:0], FRAME.iloc[:3], FRAME.iloc[3:4], FRAME.iloc[4:]]
+
+
+def _read(data, fmt, compress=False):
+    if compress:
+        data = gzip.decompress(data)
+    f = io.BytesIO(data)
+    if fmt == 'csv':
+        return pd.read_csv(f)
+    if fmt == 'ndjson':
+        return pd.read_json(f, lines=True)
+    if fmt == 'json':
+        return pd.read_json(f)
+    if fmt == 'excel':
+        return pd.read_excel(f)
+    if fmt == 'parquet':
+        return pd.read_parquet(f)
+    return pd.read_feather(f)
+
+
+def _assert_same(result):
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), FRAME, check_dtype=False)
+
+
+@pytest.mark.parametrize('fmt', available_formats())
+def test_round_trip(fmt):
+    f = io.BytesIO()
+    assert write_export(_chunks(), f, fmt) == len(FRAME)
+    _assert_same(_read(f.getvalue(), fmt))
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'ndjson', 'json'] + [f for f in ['parquet'] if f in available_formats()])
+def test_round_trip_compressed(fmt):
+    f = spool_export(iter(_chunks()), fmt, compress=True)
+    data = f.read()
+    f.close()
+    # Parquet compresses its columns instead of the whole file
+    _assert_same(_read(data, fmt, compress=fmt != 'parquet'))
+
+
+def test_json_keeps_slashes_unescaped():
+    f = io.BytesIO()
+    write_export(FRAME, f, 'json')
+    assert b'https://www.linkedin.com/in/p-0' in f.getvalue()
+
+
+def test_excel_continues_on_a_new_sheet(monkeypatch):
+    monkeypatch.setattr(export_module, 'EXCEL_MAX_ROWS', 4)
+    f = io.BytesIO()
+    write_export(_chunks(), f, 'excel')
+    sheets = pd.read_excel(io.BytesIO(f.getvalue()), sheet_name=None)
+    assert list(sheets) == ['Results', 'Results 2', 'Results 3']
+    _assert_same(pd.concat(sheets.values()))
+
+
+def test_empty_export_keeps_the_header(tmp_path):
+    path = str(tmp_path / export_filename('results', 'csv'))
+    assert write_export(FRAME.iloc[:0], path, 'csv') == 0
+    assert list(pd.read_csv(path).columns) == list(FRAME.columns)
+
+
+def test_unsupported_combinations_are_rejected():
+    with pytest.raises(ValueError, match='unknown export format'):
+        write_export(FRAME, io.BytesIO(), 'xml')
+    with pytest.raises(ValueError, match='not supported for excel'):
+        write_export(FRAME, io.BytesIO(), 'excel', compress=True)
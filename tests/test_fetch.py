@@ -0,0 +1,147 @@
+"""HttpFetcher and CircuitBreaker, against the local stand-in API."""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from linkedin_core import (
+    CircuitBreaker,
+    CircuitOpenError,
+    FetchError,
+    HttpFetcher,
+    LinkedInScraper,
+    Metrics,
+    StandInServer,
+    endpoint_key,
+    profile_endpoint,
+)
+
+URL = 'https://www.linkedin.com/in/person-0'
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class _BrokenApi:
+    """Answers /in/html with a 200 HTML page, /in/partial with a profile missing
+    its fields, /in/cut with a body shorter than its Content-Length, and
+    anything else with a valid profile."""
+
+    def __init__(self):
+        profile = LinkedInScraper(simulate_delay=False).extract_profile_data(URL)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                slug = self.path.rsplit('/', 1)[-1]
+                body = {'html': b'<html>maintenance</html>', 'partial': b'{"profile_name": "x"}'}.get(
+                    slug, json.dumps(profile).encode())
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body) + (100 if slug == 'cut' else 0)))
+                self.end_headers()
+                self.wfile.write(body)
+                self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.endpoint = f"http://127.0.0.1:{self.httpd.server_address[1]}/in/{{slug}}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_fetcher_returns_the_simulated_profile():
+    expected = LinkedInScraper(simulate_delay=False).extract_profile_data(URL)
+    with StandInServer() as server:
+        data = HttpFetcher().get_json(profile_endpoint(server.endpoint, URL))
+    assert data == expected
+
+
+def test_fetcher_retries_then_raises():
+    fetcher = HttpFetcher(max_retries=2, backoff_base=0, breaker=CircuitBreaker(failure_threshold=10))
+    with StandInServer(error_rate=1.0) as server:
+        with pytest.raises(FetchError, match='after 3 attempts'):
+            fetcher.get(profile_endpoint(server.endpoint, URL))
+    assert server.requests == 3
+
+
+def test_fetcher_revalidates_with_etag():
+    fetcher = HttpFetcher()
+    with StandInServer() as server:
+        url = profile_endpoint(server.endpoint, URL)
+        data, etag = fetcher.get_json_if_changed(url)
+        assert data is not None and etag
+        assert fetcher.get_json_if_changed(url, etag) == (None, etag)
+    assert server.not_modified == 1
+
+
+def test_fetcher_gives_up_on_a_dead_host():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    fetcher = HttpFetcher(max_retries=3, backoff_base=0, breaker=breaker, breaker_wait=0.1)
+    url = f'http://127.0.0.1:{_closed_port()}/in/x'
+    start = time.monotonic()
+    with pytest.raises(CircuitOpenError):
+        fetcher.get(url)
+    assert time.monotonic() - start < 5
+    assert breaker.is_open(endpoint_key(url))
+
+
+def test_breaker_opens_probes_and_closes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure('api')
+    assert breaker.allow('api')
+    breaker.record_failure('api')
+    assert breaker.is_open('api') and not breaker.allow('api')
+    time.sleep(0.06)
+    # Half-open: one probe goes through, everyone else waits for its outcome
+    assert breaker.allow('api')
+    assert not breaker.allow('api')
+    breaker.record_success('api')
+    assert not breaker.is_open('api') and breaker.allow('api')
+
+
+def test_breaker_wait_blocks_until_reset():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    breaker.record_failure('api')
+    start = time.monotonic()
+    assert breaker.wait('api')
+    assert time.monotonic() - start >= 0.09
+
+
+def test_breaker_wait_gives_up_after_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure('api')
+    assert not breaker.wait('api', timeout=0.05)
+    assert breaker.wait('other', timeout=0.05)
+
+
+@pytest.mark.parametrize('slug', ['html', 'cut'])
+def test_fetcher_turns_bad_bodies_into_fetch_errors(slug):
+    fetcher = HttpFetcher(max_retries=1, backoff_base=0)
+    with _BrokenApi() as api:
+        with pytest.raises(FetchError):
+            fetcher.get_json(api.endpoint.format(slug=slug))
+
+
+def test_bad_profiles_do_not_abort_the_batch():
+    urls = [f'https://www.linkedin.com/in/{slug}' for slug in ('html', 'ok', 'partial', 'cut')]
+    with _BrokenApi() as api:
+        scraper = LinkedInScraper(metrics=Metrics(), endpoint=api.endpoint)
+        scraper.fetcher.max_retries = 0
+        results = scraper.process_urls(urls, max_workers=4)
+    assert set(results['profile_url']) == {urls[1]}
+    assert scraper.metrics.counters['fetch_errors'] == 3
@@ -0,0 +1,72 @@
+"""Append-only job journals and resume."""
+
+import pandas as pd
+
+from linkedin_core import JobJournal, LinkedInScraper, job_id
+from linkedin_core.cli import main
+
+URLS = [f'https://www.linkedin.com/in/person-{i}' for i in range(8)]
+
+
+def test_journal_resumes_without_redoing_work(tmp_path):
+    calls = []
+
+    def extract(url):
+        calls.append(url)
+        return (url.upper(), [1, 2])
+
+    journal = JobJournal('job', tmp_path)
+    first = [journal.wrap(extract)(url) for url in URLS[:5]]
+    journal.close()
+
+    journal = JobJournal('job', tmp_path)
+    assert len(journal) == 5 and URLS[0] in journal
+    calls.clear()
+    resumed = [journal.wrap(extract)(url) for url in URLS[:8]]
+    journal.close()
+    assert calls == URLS[5:8]
+    # Replayed items come back as the tuples that were recorded
+    assert resumed[:5] == first
+    assert isinstance(resumed[0], tuple)
+
+
+def test_journal_skips_failed_items(tmp_path):
+    journal = JobJournal('job', tmp_path)
+    assert journal.wrap(lambda url: None)(URLS[0]) is None
+    journal.close()
+    journal = JobJournal('job', tmp_path)
+    assert URLS[0] not in journal
+    journal.close()
+
+
+def test_journal_truncates_a_partial_line(tmp_path):
+    journal = JobJournal('job', tmp_path)
+    journal.record(URLS[0], 'a')
+    journal.close()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"url": "cut sh')
+
+    journal = JobJournal('job', tmp_path)
+    assert len(journal) == 1
+    journal.record(URLS[1], 'b')
+    journal.close()
+    journal = JobJournal('job', tmp_path)
+    assert journal.get(URLS[0]) == 'a' and journal.get(URLS[1]) == 'b'
+    journal.remove()
+
+
+def test_cli_journals_each_scraper_type_separately(tmp_path, capsys):
+    # An interrupted basic run left its rows behind under --job-id job
+    basic = LinkedInScraper(simulate_delay=False)
+    journal = JobJournal(job_id(basic, 'job'), tmp_path / 'jobs')
+    journal.wrap(basic.process_url)(URLS[0])
+    journal.close()
+    (tmp_path / 'urls.txt').write_text('\n'.join(URLS))
+
+    args = [str(tmp_path / 'urls.txt'), '--job-id', 'job', '--journal-dir', str(tmp_path / 'jobs')]
+    assert main([*args, '--enhanced', '-o', str(tmp_path / 'pro.csv')]) == 0
+    assert 'Resuming' not in capsys.readouterr().err
+    assert set(pd.read_csv(tmp_path / 'pro.csv')['profile_url']) == set(URLS)
+
+    assert main([*args, '-o', str(tmp_path / 'basic.csv')]) == 0
+    assert 'Resuming job job: 1 profiles already done.' in capsys.readouterr().err
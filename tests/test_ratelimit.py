@@ -0,0 +1,39 @@
+"""Adaptive per-host token buckets."""
+
+from linkedin_core import HttpFetcher, RateLimiter, StandInServer, endpoint_key, profile_endpoint
+
+
+def test_fetcher_slows_down_on_429():
+    limiter = RateLimiter(rate=100, burst=100)
+    fetcher = HttpFetcher(max_retries=10, limiter=limiter)
+    with StandInServer(rate_limit=5) as server:
+        urls = [profile_endpoint(server.endpoint, f'https://www.linkedin.com/in/p{i}') for i in range(20)]
+        assert all(fetcher.get(url).ok for url in urls)
+    assert server.throttled > 0
+    assert limiter.rates()[endpoint_key(urls[0])] < 100
+
+
+def test_rate_limiter_burst_then_throttles():
+    limiter = RateLimiter(rate=1, burst=3)
+    assert [limiter.try_acquire('http://a/') for _ in range(4)] == [True, True, True, False]
+    # Buckets are per host
+    assert limiter.try_acquire('http://b/')
+
+
+def test_rate_limiter_adapts():
+    limiter = RateLimiter(rate=8, min_rate=1, rate_step=2, success_window=3)
+    limiter.penalize('http://a/')
+    assert limiter.rates()['a'] == 4
+    for _ in range(3):
+        limiter.reward('http://a/')
+    assert limiter.rates()['a'] == 6
+    for _ in range(5):
+        limiter.penalize('http://a/')
+    assert limiter.rates()['a'] == 1
+
+
+def test_rate_limiter_honours_retry_after():
+    limiter = RateLimiter(rate=100, burst=100)
+    limiter.penalize('http://a/', retry_after=0.1)
+    assert not limiter.try_acquire('http://a/')
+    assert limiter.acquire('http://a/') >= 0.05
@@ -0,0 +1,19 @@
+"""Result rows of the two scrapers."""
+
+import pytest
+
+from linkedin_core import EnhancedLinkedInScraper, LinkedInScraper
+
+
+@pytest.mark.parametrize('scraper_class', [LinkedInScraper, EnhancedLinkedInScraper])
+def test_rows_keep_the_uploaded_url(scraper_class):
+    urls = ['http://linkedin.com/in/jane?trk=x', 'not a url', ' https://uk.linkedin.com/in/Jane/ ', 'https://www.linkedin.com/in/bob']
+    results = scraper_class(simulate_delay=False).process_urls(urls, normalized=True)
+    if scraper_class is EnhancedLinkedInScraper:
+        results, profiles = results
+        # Detailed profiles are per distinct profile, under its canonical URL
+        assert [p['linkedin_url'] for p in profiles] == ['https://www.linkedin.com/in/jane', 'https://www.linkedin.com/in/bob']
+    rows, _ = results
+    assert rows['profile_url'].tolist() == [urls[0], urls[2], urls[3]]
+    # Both spellings of jane are one profile
+    assert rows.iloc[0].drop(['profile_id', 'profile_url']).equals(rows.iloc[1].drop(['profile_id', 'profile_url']))
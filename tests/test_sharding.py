@@ -0,0 +1,38 @@
+"""Process-pool sharding of simulated profile generation."""
+
+import pytest
+
+from linkedin_core import EnhancedLinkedInScraper, JobJournal, LinkedInScraper, ProfileCache
+from linkedin_core.cli import main
+
+URLS = [f'https://www.linkedin.com/in/person-{i % 40}' for i in range(60)] + ['not a url']
+
+
+@pytest.mark.parametrize('scraper_class', [LinkedInScraper, EnhancedLinkedInScraper])
+def test_sharded_run_matches_a_single_process_run(scraper_class):
+    sharded = scraper_class(simulate_delay=False).process_urls(URLS, processes=2, normalized=True)
+    threaded = scraper_class(simulate_delay=False).process_urls(URLS, max_workers=4, normalized=True)
+    if scraper_class is EnhancedLinkedInScraper:
+        sharded, threaded = sharded[0], threaded[0]
+    for left, right in zip(sharded, threaded):
+        assert left.equals(right)
+
+
+def test_processes_refuse_settings_the_workers_would_drop(tmp_path):
+    cache = ProfileCache(str(tmp_path / 'c.sqlite3'))
+    with pytest.raises(ValueError):
+        LinkedInScraper(simulate_delay=False, cache=cache).process_urls(URLS, processes=2)
+    cache.close()
+    with pytest.raises(ValueError):
+        LinkedInScraper(endpoint='http://127.0.0.1:9/in/{slug}').process_urls(URLS, processes=2)
+    journal = JobJournal('job', tmp_path)
+    with pytest.raises(ValueError):
+        LinkedInScraper(simulate_delay=False).process_urls(URLS, processes=2, journal=journal)
+    journal.close()
+
+
+@pytest.mark.parametrize('flag', [['--cache', 'c.sqlite3'], ['--job-id', 'j'], ['--endpoint', 'http://127.0.0.1:9/in/{slug}']])
+def test_cli_rejects_processes_with_dropped_settings(flag, capsys):
+    with pytest.raises(SystemExit):
+        main(['-p', '2', *flag])
+    assert '--processes cannot be combined with' in capsys.readouterr().err
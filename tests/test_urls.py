@@ -0,0 +1,59 @@
+"""URL canonicalization, validation and the de-duplicating UrlIndex."""
+
+import itertools
+
+import pandas as pd
+
+from linkedin_core import UrlIndex, canonicalize_url, validate_urls
+
+SCHEMES = ['', 'https://', 'HTTP://', 'ftp://', '//', 'https:/']
+USERINFO = ['', 'user@', 'a:b@']
+HOSTS = ['www.linkedin.com', 'linkedin.com', 'UK.LinkedIn.com', '.linkedin.com', 'linkedin.com.evil.com',
+         'evil.com', 'www.linkedin.com\t', 'xn--bcher-kva.linkedin.com', 'lınkedin.com', '[linkedin.com']
+PORTS = ['', ':443', ':', ':abc']
+PATHS = ['/in/Jane-Doe', '/in/jane', '/in/ jane', '/in//jane', '/in/', '/IN/jane', '/in/j%C3%A9', '/in/a%2Fb',
+         '/in/jane;x', '/in/jane%20', '/in/jöhn', '/pub/jane', '', '/in']
+SUFFIXES = ['', '/', '/detail/skills/', '?trk=x', '#top', '?u=http://a.com/in/x', ' ', '/ x']
+
+
+def _corpus():
+    for parts in itertools.product(SCHEMES, USERINFO, HOSTS, PORTS, PATHS, SUFFIXES):
+        yield ''.join(parts)
+    yield from [None, 42, '', '   ', 'not a url', 'jane doe', '\nhttps://www.linkedin.com/in/jane\n']
+
+
+def test_index_and_validation_agree_with_canonicalize_url():
+    urls = list(_corpus())
+    expected = [canonicalize_url(url) for url in urls]
+    index = UrlIndex(urls)
+    got = [index.unique[slot] if slot >= 0 else None for slot in index.positions]
+    assert got == expected
+    report = validate_urls(urls)
+    assert report['valid'].tolist() == [url is not None for url in expected]
+    assert (report['reason'] == '').tolist() == report['valid'].tolist()
+
+
+def test_canonicalize_url_spellings():
+    assert canonicalize_url('uk.linkedin.com/in/Jane-Doe/?trk=x') == 'https://www.linkedin.com/in/jane-doe'
+    assert canonicalize_url('http://user@linkedin.com:80/in/jane#top') == 'https://www.linkedin.com/in/jane'
+    assert canonicalize_url('www.linkedin.com/in/jane?next=https://x.com') == 'https://www.linkedin.com/in/jane'
+    # Whitespace inside a URL is a broken paste, not part of the profile id
+    assert canonicalize_url('https://www.linkedin.com/in/ jane') is None
+    assert canonicalize_url('https://www.linkedin.com\t/in/jane') is None
+
+
+def test_validate_urls_reasons():
+    urls = ['', 'jane doe', 'https://example.com/in/jane', 'https://www.linkedin.com/in/ jane',
+            'https://www.linkedin.com/company/x', 'linkedin.com/in/jane']
+    report = validate_urls(pd.Series(urls))
+    assert report['reason'].tolist() == ['empty', 'not a URL', 'wrong host', 'bad profile id', 'missing /in/', '']
+
+
+def test_index_deduplicates_in_first_seen_order():
+    urls = ['linkedin.com/in/b', 'bad', 'https://www.linkedin.com/in/A', 'https://uk.linkedin.com/in/b/']
+    index = UrlIndex(urls)
+    assert index.unique == ['https://www.linkedin.com/in/b', 'https://www.linkedin.com/in/a']
+    assert index.positions.tolist() == [0, -1, 1, 0]
+    assert index.invalid == 1
+    rows = list(index.iter_slots(['B', 'A']))
+    assert rows == [(urls[0], 0, 'B'), (urls[2], 1, 'A'), (urls[3], 0, 'B')]